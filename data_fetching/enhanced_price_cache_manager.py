@@ -92,10 +92,10 @@ class EnhancedPriceCacheManager(PriceCacheManager):
                 return []
                 
             if isinstance(open_timestamp, str):
-                from reporting.data_loader import _parse_custom_timestamp
+                from extraction.parsing_utils import _parse_custom_timestamp
                 open_timestamp = _parse_custom_timestamp(open_timestamp)
             if isinstance(close_timestamp, str):
-                from reporting.data_loader import _parse_custom_timestamp  
+                from extraction.parsing_utils import _parse_custom_timestamp  
                 close_timestamp = _parse_custom_timestamp(close_timestamp)
                 
             ochlv_data = self.fetch_ochlv_data(
@@ -120,10 +120,10 @@ class EnhancedPriceCacheManager(PriceCacheManager):
                 return {'has_price_data': False, 'has_volume_data': False, 'is_complete': False}
                 
             if isinstance(open_timestamp, str):
-                from reporting.data_loader import _parse_custom_timestamp
+                from extraction.parsing_utils import _parse_custom_timestamp
                 open_timestamp = _parse_custom_timestamp(open_timestamp)
             if isinstance(close_timestamp, str):
-                from reporting.data_loader import _parse_custom_timestamp
+                from extraction.parsing_utils import _parse_custom_timestamp
                 close_timestamp = _parse_custom_timestamp(close_timestamp)
                 
             timeframe = self._determine_timeframe_from_duration(open_timestamp, close_timestamp)
@@ -98,8 +98,8 @@ def run_comprehensive_report_offline():
     """Wrapper function to generate the final HTML report in explicit offline mode."""
     print_header("Step 5: Generate Comprehensive Report (Offline)")
     try:
-        orchestrator = PortfolioAnalysisOrchestrator(api_key=None)
-        result = orchestrator.run_comprehensive_analysis('positions_to_analyze.csv')
+        with PortfolioAnalysisOrchestrator(api_key=None) as orchestrator:
+            result = orchestrator.run_comprehensive_analysis('positions_to_analyze.csv')
         if result.get('status') == 'SUCCESS':
             print("\nComprehensive report generated successfully!")
             report_path = result.get('files_generated', {}).get('html_report', 'N/A')
@@ -73,7 +73,7 @@ class TpSlOptimizer:
             # Load positions data
             self.positions_df = pd.read_csv("positions_to_analyze.csv")
             # Parse timestamps
-            from reporting.data_loader import _parse_custom_timestamp
+            from extraction.parsing_utils import _parse_custom_timestamp
             self.positions_df['open_timestamp'] = self.positions_df['open_timestamp'].apply(_parse_custom_timestamp)
             self.positions_df['close_timestamp'] = self.positions_df['close_timestamp'].apply(_parse_custom_timestamp)
             logger.info(f"Loaded {len(self.positions_df)} positions")
@@ -7,8 +7,9 @@ drawdown analysis, strategy heatmaps, and cost impact charts.
 
 import logging
 import os
+from concurrent.futures import Executor, as_completed
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
 import matplotlib.pyplot as plt
 import seaborn as sns
 from matplotlib.figure import Figure
@@ -51,14 +52,37 @@ class ChartGenerator:
 
     def _ensure_charts_directory(self):
         """Create charts output directory if it doesn't exist."""
-        if not os.path.exists(self.output_dir):
+        # Attempt the mkdir directly instead of exists()+makedirs() - one call, no check-then-create race
+        try:
             os.makedirs(self.output_dir)
             logger.info(f"Created charts directory: {self.output_dir}")
+        except FileExistsError:
+            pass
 
     def _generate_timestamp(self) -> str:
         """Generate timestamp for chart filenames."""
         return datetime.now().strftime(self.timestamp_format)
 
+    @staticmethod
+    def _new_figure(nrows: int = 1, ncols: int = 1, **subplot_kwargs) -> Tuple[Figure, Any]:
+        """
+        Create a figure outside pyplot's global figure registry.
+        
+        AIDEV-PERF-CLAUDE: object-oriented Figures carry no shared "current figure" state, so charts can be
+        built concurrently (generate_all_charts with an executor). Layout is applied with fig.tight_layout().
+        savefig renders through Agg for PNG output regardless of pyplot's backend, so none is forced globally.
+        
+        Args:
+            nrows (int): Subplot rows
+            ncols (int): Subplot columns
+            **subplot_kwargs: figsize plus any Figure.subplots keyword (e.g. gridspec_kw)
+            
+        Returns:
+            Tuple[Figure, Any]: (figure, axes as returned by Figure.subplots)
+        """
+        fig = Figure(figsize=subplot_kwargs.pop('figsize', None))
+        return fig, fig.subplots(nrows, ncols, **subplot_kwargs)
+
     def _save_chart(self, fig: Figure, chart_name: str, timestamp: str) -> str:
         """Save chart with timestamped filename."""
         filename = f"{chart_name}_{timestamp}.png"
@@ -75,7 +99,7 @@ class ChartGenerator:
     
     def _create_empty_chart(self, title: str, chart_name: str, timestamp: str) -> str:
         """Creates and saves a chart indicating no data is available."""
-        fig, ax = plt.subplots(figsize=(12, 8))
+        fig, ax = self._new_figure(figsize=(12, 8))
         ax.text(0.5, 0.5, 'No Data Available', ha='center', va='center', transform=ax.transAxes, fontsize=16)
         ax.set_title(title)
         return self._save_chart(fig, chart_name, timestamp)
@@ -86,9 +110,9 @@ class ChartGenerator:
             logger.warning("No daily data for equity curve")
             return self._create_empty_chart('Portfolio Equity Curve - No Data', 'equity_curve', timestamp)
 
-        fig, ax1 = plt.subplots(1, 1, figsize=(14, 8)) # Create a single plot
+        fig, ax1 = self._new_figure(1, 1, figsize=(14, 8)) # Create a single plot
         plot_equity_curve(ax1, analysis_result) # Pass only one axis
-        plt.tight_layout()
+        fig.tight_layout()
         return self._save_chart(fig, 'equity_curve', timestamp)
 
     def create_drawdown_analysis(self, analysis_result: Dict[str, Any], timestamp: str) -> str:
@@ -97,9 +121,9 @@ class ChartGenerator:
             logger.warning("No daily data for drawdown analysis")
             return self._create_empty_chart('Drawdown Analysis - No Data', 'drawdown_analysis', timestamp)
 
-        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(14, 10), gridspec_kw={'height_ratios': [2, 1]})
+        fig, (ax1, ax2) = self._new_figure(2, 1, figsize=(14, 10), gridspec_kw={'height_ratios': [2, 1]})
         plot_drawdown_analysis(ax1, ax2, analysis_result)
-        plt.tight_layout()
+        fig.tight_layout()
         return self._save_chart(fig, 'drawdown_analysis', timestamp)
 
     def create_strategy_heatmap(self, analysis_result: Dict[str, Any], timestamp: str) -> str:
@@ -108,7 +132,7 @@ class ChartGenerator:
             logger.warning("No positions data for strategy heatmap")
             return self._create_empty_chart('Strategy Heatmap - No Data', 'strategy_heatmap', timestamp)
 
-        fig, axes = plt.subplots(1, 3, figsize=(20, 10))
+        fig, axes = self._new_figure(1, 3, figsize=(20, 10))
         try:
             if not os.path.exists("strategy_instances.csv"):
                 raise FileNotFoundError("strategy_instances.csv not found, using fallback.")
@@ -116,25 +140,35 @@ class ChartGenerator:
         except Exception as e:
             logger.warning(f"Failed to create heatmap from instances ({e}), attempting fallback.")
             plt.close(fig) # Close the old figure
-            fig, axes = plt.subplots(1, 3, figsize=(18, 8)) # Create a new one for fallback
+            fig, axes = self._new_figure(1, 3, figsize=(18, 8)) # Create a new one for fallback
             try:
                 plot_heatmap_from_positions(fig, axes, analysis_result['raw_data']['positions_df'], self.config)
             except Exception as fallback_e:
                 logger.error(f"Fallback heatmap also failed: {fallback_e}")
                 return self._create_empty_chart(f'Heatmap Failed: {fallback_e}', 'strategy_heatmap', timestamp)
 
-        plt.tight_layout(rect=[0, 0, 1, 0.93])
+        fig.tight_layout(rect=[0, 0, 1, 0.93])
         return self._save_chart(fig, 'strategy_heatmap', timestamp)
 
     def create_cost_impact_chart(self, analysis_result: Dict[str, Any], timestamp: str) -> str:
         """Create infrastructure cost impact chart."""
-        fig, axes = plt.subplots(2, 2, figsize=(15, 10))
+        fig, axes = self._new_figure(2, 2, figsize=(15, 10))
         plot_cost_impact(fig, axes, analysis_result)
-        plt.tight_layout()
+        fig.tight_layout()
         return self._save_chart(fig, 'cost_impact', timestamp)
 
-    def generate_all_charts(self, analysis_result: Dict[str, Any]) -> Dict[str, str]:
-        """Generate all portfolio charts with a consistent timestamp."""
+    def generate_all_charts(self, analysis_result: Dict[str, Any],
+                            executor: Optional[Executor] = None) -> Dict[str, str]:
+        """
+        Generate all portfolio charts with a consistent timestamp.
+        
+        Args:
+            analysis_result (Dict[str, Any]): Portfolio analysis result (needs 'raw_data')
+            executor (Optional[Executor]): When given, each chart is built and saved on its own worker
+            
+        Returns:
+            Dict[str, str]: Chart name -> file path (or "ERROR: ..." message), in the usual chart order
+        """
         timestamp = self._generate_timestamp()
         chart_files = {}
         chart_functions = {
@@ -144,12 +178,26 @@ class ChartGenerator:
             'cost_impact': self.create_cost_impact_chart
         }
 
-        for name, func in chart_functions.items():
-            try:
-                chart_files[name] = func(analysis_result, timestamp)
-            except Exception as e:
-                logger.error(f"Failed to generate {name} chart: {e}", exc_info=True)
-                chart_files[name] = f"ERROR: {e}"
+        if executor is not None:
+            futures = {
+                executor.submit(func, analysis_result, timestamp): name for name, func in chart_functions.items()
+            }
+            outcomes = {}
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    outcomes[name] = future.result()
+                except Exception as e:
+                    logger.error(f"Failed to generate {name} chart: {e}", exc_info=True)
+                    outcomes[name] = f"ERROR: {e}"
+            chart_files = {name: outcomes[name] for name in chart_functions}
+        else:
+            for name, func in chart_functions.items():
+                try:
+                    chart_files[name] = func(analysis_result, timestamp)
+                except Exception as e:
+                    logger.error(f"Failed to generate {name} chart: {e}", exc_info=True)
+                    chart_files[name] = f"ERROR: {e}"
         
         # AIDEV-NOTE-CLAUDE: This call was outside the loop, now handled in _save_chart
         # plt.close('all') 
@@ -4,30 +4,124 @@ Data Loader and Preparator for Portfolio Analytics
 Handles loading, validation, cleaning, and preparation of position data
 from CSV files.
 """
+import importlib.metadata
+import importlib.util
 import logging
+import re
 import pandas as pd
+import numpy as np
 import sys
 from pathlib import Path
+from typing import Optional, Sequence, Tuple
 
 # AIDEV-NOTE-CLAUDE: This ensures project root is on the path for module resolution
-sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+_PROJECT_ROOT = str(Path(__file__).resolve().parent.parent.parent)
+if _PROJECT_ROOT not in sys.path:
+    sys.path.append(_PROJECT_ROOT)
 
 # AIDEV-NOTE-CLAUDE: Import moved to a shared utility to avoid code duplication.
-from extraction.parsing_utils import _parse_custom_timestamp
+from extraction.timestamp_parsing import parse_timestamp_series
 
 logger = logging.getLogger(__name__)
 
+_LOADER_COLUMNS = ('pnl_sol', 'strategy_raw', 'investment_sol', 'open_timestamp', 'close_timestamp')
+# Optional packages each engine needs (polars converts to pandas through pyarrow)
+_IO_ENGINES = {'pandas': (), 'pyarrow': ('pyarrow',), 'polars': ('polars', 'pyarrow')}
+# Oldest release whose API the engine branch uses (polars: LazyFrame.collect_schema, added in 1.0)
+_ENGINE_MIN_VERSIONS = {'polars': (1, 0)}
 
-def load_and_prepare_positions(file_path: str, min_threshold: float) -> pd.DataFrame:
+
+def _version_tuple(version: str) -> Tuple[int, ...]:
+    """Leading numeric release components of a version string ('1.2.0rc1' -> (1, 2, 0))."""
+    match = re.match(r'\d+(?:\.\d+)*', version)
+    return tuple(int(part) for part in match.group(0).split('.')) if match else ()
+
+
+def _read_positions_csv(file_path: str, usecols: Optional[Sequence[str]], engine: str,
+                        min_threshold: float = 0.0) -> Tuple[pd.DataFrame, int]:
+    """
+    Read the positions CSV with the configured engine.
+
+    Args:
+        file_path (str): Path to positions CSV
+        usecols (Optional[Sequence[str]]): Columns to read (None = all)
+        engine (str): 'pandas' (C parser), 'pyarrow' or 'polars'; optional engines that are not
+            installed (or older than _ENGINE_MIN_VERSIONS) fall back to 'pandas' with a warning
+        min_threshold (float): With 'pyarrow' or 'polars', rows with |pnl_sol| below this are dropped before
+            conversion to pandas (the caller's filter then removes nothing)
+
+    Returns:
+        Tuple[pd.DataFrame, int]: Raw positions with NumPy-backed dtypes (timestamps still unparsed) and the
+            number of rows in the file, counted before any threshold filtering done by the reader
+    """
+    # AIDEV-PERF-CLAUDE: multithreaded Arrow/Polars readers for large position logs (opt-in via io.engine).
+    # Results are converted to NumPy-backed columns - downstream code relies on .dt/.str and to_numpy().
+    if engine not in _IO_ENGINES:
+        logger.warning(f"Unknown io engine '{engine}', using pandas")
+        engine = 'pandas'
+    missing = [package for package in _IO_ENGINES[engine] if importlib.util.find_spec(package) is None]
+    if missing:
+        logger.warning(f"io engine '{engine}' needs {', '.join(missing)}, which is not installed; using pandas")
+        engine = 'pandas'
+    if engine in _ENGINE_MIN_VERSIONS:
+        installed = importlib.metadata.version(engine)
+        if _version_tuple(installed) < _ENGINE_MIN_VERSIONS[engine]:
+            required = '.'.join(map(str, _ENGINE_MIN_VERSIONS[engine]))
+            logger.warning(f"io engine '{engine}' {installed} is older than {required}, using pandas")
+            engine = 'pandas'
+
+    if engine == 'polars':
+        import polars as pl
+        # Wide schema inference so sparse numeric columns aren't typed from the first 100 rows only
+        lazy = pl.scan_csv(file_path, infer_schema_length=10000)
+        if usecols:
+            lazy = lazy.select(list(usecols))
+        if min_threshold > 0 and 'pnl_sol' in lazy.collect_schema().names():
+            # Pushed into the scan by the lazy optimizer; null pnl is dropped, as NaN is in the pandas filter.
+            # collect_all evaluates the row count and the filtered frame over one shared scan.
+            kept = lazy.filter(pl.col('pnl_sol').abs() >= min_threshold)
+            counted, frame = pl.collect_all([lazy.select(pl.len()), kept])
+            return frame.to_pandas(), int(counted.item())
+        frame = lazy.collect()
+        return frame.to_pandas(), frame.height
+    if engine == 'pyarrow':
+        import pyarrow.compute as pc
+        from pyarrow import csv as pa_csv
+        table = pa_csv.read_csv(
+            file_path, convert_options=pa_csv.ConvertOptions(include_columns=list(usecols) if usecols else None)
+        )
+        read_count = table.num_rows
+        if min_threshold > 0 and 'pnl_sol' in table.column_names:
+            # Null pnl compares as null and is dropped, matching the NaN >= threshold -> False filter in pandas
+            table = table.filter(pc.greater_equal(pc.abs(table['pnl_sol']), min_threshold))
+        return table.to_pandas(), read_count
+    positions_df = pd.read_csv(file_path, usecols=usecols)
+    return positions_df, len(positions_df)
+
+
+def load_and_prepare_positions(file_path: str, min_threshold: float,
+                               usecols: Optional[Sequence[str]] = None, engine: str = 'pandas') -> pd.DataFrame:
     """
     Load, validate, and prepare positions data from a CSV file.
 
     This function is now the SINGLE SOURCE OF TRUTH for data loading and cleaning,
     including robust, multi-format timestamp parsing.
+
+    Args:
+        file_path (str): Path to positions CSV
+        min_threshold (float): Minimum absolute PnL (SOL) for a position to be kept
+        usecols (Optional[Sequence[str]]): Column projection for callers needing only a subset
+            (e.g. metrics_calculator.REQUIRED_COLUMNS). Columns the loader itself needs are always read;
+            names absent from the file are ignored. None reads every column.
+        engine (str): CSV reader - 'pandas' (default), 'pyarrow' or 'polars' (config: io.engine)
     """
     try:
-        positions_df = pd.read_csv(file_path)
-        logger.info(f"Loaded {len(positions_df)} positions from {file_path}")
+        if usecols is not None:
+            header = pd.read_csv(file_path, nrows=0).columns
+            wanted = set(usecols) | set(_LOADER_COLUMNS)
+            usecols = [col for col in header if col in wanted]
+        positions_df, read_count = _read_positions_csv(file_path, usecols, engine, min_threshold)
+        logger.info(f"Loaded {read_count} positions from {file_path}")
     except FileNotFoundError:
         logger.error(f"Positions file not found: {file_path}")
         raise
@@ -37,37 +131,31 @@ def load_and_prepare_positions(file_path: str, min_threshold: float) -> pd.DataF
     if not all(col in positions_df.columns for col in required_csv_columns):
         raise ValueError(f"Missing one or more required columns in {file_path}: {required_csv_columns}")
 
+    # Apply minimum threshold filter before the per-row timestamp parsing, so dropped rows are never parsed.
+    # The count includes rows the pyarrow/polars readers already dropped while reading.
+    positions_df = positions_df[abs(positions_df['pnl_sol']) >= min_threshold].copy()
+    if (filtered_count := read_count - len(positions_df)) > 0:
+        logger.info(f"Filtered {filtered_count} positions below {min_threshold} SOL threshold")
+
     # Extract strategy and step_size
-    positions_df['strategy'] = positions_df['strategy_raw'].str.extract(r'(Bid-Ask|Spot)', expand=False).fillna('Bid-Ask')
-    positions_df['step_size'] = positions_df['strategy_raw'].str.extract(r'(SIXTYNINE|MEDIUM|NARROW|WIDE)', expand=False).fillna('MEDIUM')
+    # AIDEV-PERF-CLAUDE: strategy_raw has a handful of distinct values, so both regexes run over the uniques
+    # only and results are gathered back by code. (One two-group regex can't replace the pair: either token
+    # may be missing or come first, and the lookahead form that handles that is slower than two scans.)
+    codes, uniques = pd.factorize(positions_df['strategy_raw'])
+    uniques = pd.Series(uniques, dtype=object)
+    for col, pattern, default in (('strategy', r'(Bid-Ask|Spot)', 'Bid-Ask'),
+                                  ('step_size', r'(SIXTYNINE|MEDIUM|NARROW|WIDE)', 'MEDIUM')):
+        # Trailing default slot: factorize codes missing strategy_raw as -1
+        values = np.append(uniques.str.extract(pattern, expand=False).fillna(default).to_numpy(dtype=object), default)
+        positions_df[col] = values[codes]
     
     # --- Robust Timestamp Parsing ---
     for col in ['open_timestamp', 'close_timestamp']:
         if col in positions_df.columns:
             initial_rows = len(positions_df)
             
-            # Convert to string to handle various inputs, then parse
-            # This ensures that previously parsed datetime objects are also handled
-            str_timestamps = positions_df[col].astype(str)
-            parsed_dates = []
-            for ts_str in str_timestamps:
-                if pd.isna(ts_str) or ts_str.lower() in ['nan', 'nat', '']:
-                    parsed_dates.append(pd.NaT)
-                    continue
-                
-                # Try standard parsing first (it's faster)
-                dt = pd.to_datetime(ts_str, errors='coerce')
-                
-                # If standard fails, try custom parser
-                if pd.isna(dt):
-                    try:
-                        dt = _parse_custom_timestamp(ts_str)
-                    except (ValueError, IndexError):
-                        dt = pd.NaT # Failed both parsers
-                
-                parsed_dates.append(dt)
-
-            positions_df[col] = pd.Series(parsed_dates, index=positions_df.index)
+            # Standard formats first, then the bot's custom "MM/DD-HH:MM:SS" format (vectorized)
+            positions_df[col] = parse_timestamp_series(positions_df[col])
 
             # Drop rows where parsing failed for either timestamp
             positions_df = positions_df.dropna(subset=[col])
@@ -78,11 +166,10 @@ def load_and_prepare_positions(file_path: str, min_threshold: float) -> pd.DataF
                     f"timestamps in '{col}'. This is expected for active positions."
                 )
 
-    # Apply minimum threshold filter
-    initial_count = len(positions_df)
-    positions_df = positions_df[abs(positions_df['pnl_sol']) >= min_threshold].copy()
-    if filtered_count := len(positions_df) < initial_count:
-        logger.info(f"Filtered {initial_count - filtered_count} positions below {min_threshold} SOL threshold")
+    # AIDEV-PERF-CLAUDE: normalized close day cached once (datetime64, not Python date objects);
+    # daily aggregations in metrics_calculator group on it directly.
+    if 'close_timestamp' in positions_df.columns:
+        positions_df['close_day'] = pd.to_datetime(positions_df['close_timestamp']).dt.normalize()
 
     if not positions_df.empty:
         logger.info(f"Data preparation complete. Returning {len(positions_df)} valid positions.")
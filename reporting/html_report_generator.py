@@ -25,6 +25,19 @@ from .visualizations.interactive import range_test_charts
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# AIDEV-PERF-CLAUDE: orjson (optional) serializes the JSON blobs embedded in the report in C and handles
+# numpy scalars natively; stdlib json with default=str is the fallback.
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(
+            obj, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS, default=str
+        ).decode()
+except ImportError:
+    def _dumps(obj: Any) -> str:
+        return json.dumps(obj, default=str)
+
 
 class HTMLReportGenerator:
     """
@@ -176,9 +189,9 @@ class HTMLReportGenerator:
             'config': self.config,
             'plotly_js': pyo.get_plotlyjs(),
             'enriched_simulation_json': enriched_simulation_json,
-            'optimal_settings_json': json.dumps(optimal_settings_map),
-            'tested_tp_levels_json': json.dumps(sorted(tested_tp_levels)),
-            'tested_sl_levels_json': json.dumps(sorted(tested_sl_levels))
+            'optimal_settings_json': _dumps(optimal_settings_map),
+            'tested_tp_levels_json': _dumps(sorted(tested_tp_levels)),
+            'tested_sl_levels_json': _dumps(sorted(tested_sl_levels))
         }
         
         return template_data
@@ -212,12 +225,12 @@ class HTMLReportGenerator:
         """Prepare enriched simulation data for Phase 4B interactive tool."""
         try:
             if not os.path.exists("reporting/output/range_test_detailed_results.csv"):
-                return json.dumps([])
+                return _dumps([])
             detailed_results_df = pd.read_csv("reporting/output/range_test_detailed_results.csv")
             positions_df = pd.read_csv("positions_to_analyze.csv")
             strategy_instances_df = pd.read_csv("strategy_instances.csv")
             
-            from reporting.data_loader import _parse_custom_timestamp
+            from extraction.parsing_utils import _parse_custom_timestamp
             positions_df['open_timestamp'] = positions_df['open_timestamp'].apply(_parse_custom_timestamp)
             
             enriched_df = pd.merge(detailed_results_df, positions_df[['position_id', 'open_timestamp']], on='position_id', how='left')
@@ -229,7 +242,7 @@ class HTMLReportGenerator:
             return enriched_df.to_json(orient='records')
         except Exception as e:
             logger.error(f"Failed to prepare enriched simulation data: {e}")
-            return json.dumps([])
+            return _dumps([])
 
     def _render_html_template(self, template_data: Dict[str, Any]) -> str:
         """Render HTML template with data."""
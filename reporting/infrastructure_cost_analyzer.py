@@ -1,3 +1,4 @@
+import glob
 import logging
 import json
 import os
@@ -10,14 +11,20 @@ import yaml
 
 # AIDEV-NOTE-CLAUDE: Import PriceCacheManager to replace old cache logic
 from .price_cache_manager import PriceCacheManager
+from utils.common import load_yaml_config
 
 # AIDEV-NOTE-GEMINI: CRITICAL FIX - Removed redundant basicConfig. 
 # It should only be called once in the main entry point (main.py).
 logger = logging.getLogger(__name__)
 
+_PRICE_CACHE_DIR = "price_cache"
+_SOL_USDC_PAIR_ADDRESS = "83v8iPyZihDEjDdY8RdZddyZNyUtXngz69Lgo9Kt5d6d"
+
 class InfrastructureCostAnalyzer:
-    def __init__(self, config_path: str = "reporting/config/portfolio_config.yaml", api_key: Optional[str] = None):
-        self.config = self._load_config(config_path)
+    def __init__(self, config_path: str = "reporting/config/portfolio_config.yaml", api_key: Optional[str] = None,
+                 config: Optional[Dict] = None):
+        # AIDEV-PERF-CLAUDE: callers that already parsed the YAML pass it as config (config_path is then unused)
+        self.config = config if config is not None else self._load_config(config_path)
         self.api_key = api_key
         
         self.monthly_costs = self.config.get('infrastructure_costs', {}).get('monthly', {})
@@ -29,20 +36,40 @@ class InfrastructureCostAnalyzer:
         
     def _load_config(self, config_path: str) -> Dict:
         try:
-            with open(config_path, 'r') as f: return yaml.safe_load(f)
+            return load_yaml_config(config_path)
         except (FileNotFoundError, yaml.YAMLError) as e:
             logger.error(f"Error loading config {config_path}: {e}")
             raise
 
+    @staticmethod
+    def rates_source_fingerprint() -> str:
+        """
+        Identity of the local SOL/USDC daily price cache that get_sol_usdc_rates reads.
+
+        Returns:
+            str: Sorted (file, mtime_ns, size) of the pair's monthly cache files - changes on every (re)fetch
+        """
+        pattern = f"{_SOL_USDC_PAIR_ADDRESS}_1d_*.json"
+        files = sorted(glob.glob(os.path.join(_PRICE_CACHE_DIR, pattern))
+                       + glob.glob(os.path.join(_PRICE_CACHE_DIR, "offline_processed", pattern)))
+        entries = []
+        for path in files:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append(f"{path}:{stat.st_mtime_ns}:{stat.st_size}")
+        return ";".join(entries)
+
     def get_sol_usdc_rates(self, start_date: str, end_date: str, force_refetch: bool = False) -> Dict[str, Optional[float]]:
         """
         Get daily SOL/USDC prices using the centralized PriceCacheManager and a proven high-liquidity pair address.
         Includes enhanced logging for cache utilization.
         """
         logger.info(f"Fetching SOL/USDC rates from {start_date} to {end_date}. Force refetch: {force_refetch}")
-        cache_manager = PriceCacheManager()
+        cache_manager = PriceCacheManager(cache_dir=_PRICE_CACHE_DIR)
         
-        sol_usdc_pair_address = "83v8iPyZihDEjDdY8RdZddyZNyUtXngz69Lgo9Kt5d6d"
+        sol_usdc_pair_address = _SOL_USDC_PAIR_ADDRESS
         
         start_dt = datetime.strptime(start_date, "%Y-%m-%d")
         end_dt = datetime.strptime(end_date, "%Y-%m-%d") + timedelta(days=1)
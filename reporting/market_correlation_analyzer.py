@@ -16,6 +16,7 @@ from typing import Dict, List, Tuple, Any, Optional
 from scipy import stats
 import sys
 import os
+from collections import OrderedDict
 
 # Add reporting module to path for imports
 # Corrected path logic
@@ -24,13 +25,81 @@ if project_root not in sys.path:
     sys.path.append(project_root)
     
 from reporting.infrastructure_cost_analyzer import InfrastructureCostAnalyzer
-from reporting.metrics_calculator import calculate_daily_returns
+from reporting.metrics_calculator import build_sol_rate_series, calculate_daily_returns
+from reporting.sol_indicators import BATCH_STAT_COLUMNS, batch_trend_stats, compute_ema_indicators
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+_INDICATOR_CACHE_SIZE = 8
+_Z_95 = 1.959963984540054  # stats.norm.ppf(0.975), two-sided 95% critical value
+
+# AIDEV-NOTE-CLAUDE: No basicConfig here - logging is configured by the entry point (main.py / portfolio_main.py).
 logger = logging.getLogger(__name__)
 
 
+def _align_positions(left_index: pd.Index, right_index: pd.Index) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Find positional indices of dates shared by two sorted, unique daily indices.
+
+    Args:
+        left_index (pd.Index): First datetime index (e.g. portfolio daily dates)
+        right_index (pd.Index): Second datetime index (e.g. SOL daily dates)
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Integer positions into left_index and right_index
+    """
+    # AIDEV-PERF-CLAUDE: merge-join on int64 ns views; avoids Index.intersection hashing and .loc label lookups.
+    left_ns = np.asarray(left_index, dtype='datetime64[ns]').view('i8')
+    right_ns = np.asarray(right_index, dtype='datetime64[ns]').view('i8')
+    _, left_pos, right_pos = np.intersect1d(left_ns, right_ns, assume_unique=True, return_indices=True)
+    return left_pos, right_pos
+
+
+def _pearson(x: np.ndarray, y: np.ndarray) -> Tuple[float, float]:
+    """
+    Compute Pearson correlation and its two-sided p-value for two aligned samples.
+
+    Args:
+        x (np.ndarray): First sample
+        y (np.ndarray): Second sample, same length as x
+
+    Returns:
+        Tuple[float, float]: (correlation coefficient, two-sided p-value)
+    """
+    # AIDEV-PERF-CLAUDE: r = xc.yc / sqrt(xc.xc * yc.yc); p-value from the t distribution, same as stats.pearsonr.
+    n = x.size
+    xc = x - x.mean()
+    yc = y - y.mean()
+    denominator = np.sqrt(xc.dot(xc) * yc.dot(yc))
+    if denominator == 0:
+        return float('nan'), float('nan')
+    r = float(np.clip(xc.dot(yc) / denominator, -1.0, 1.0))
+    if n <= 2:
+        return r, 1.0
+    if abs(r) == 1.0:
+        return r, 0.0
+    t_stat = r * np.sqrt((n - 2) / (1.0 - r * r))
+    return r, float(2 * stats.t.sf(abs(t_stat), n - 2))
+
+
+def _segment_stats(returns: np.ndarray) -> Dict[str, float]:
+    """
+    Summarize portfolio daily PnL for one SOL trend segment.
+
+    Args:
+        returns (np.ndarray): Daily PnL values falling inside the segment
+
+    Returns:
+        Dict[str, float]: Day count, mean/total return, volatility and win rate
+    """
+    days = returns.size
+    return {
+        'days': days,
+        'mean_return': float(returns.mean()) if days else 0.0,
+        'total_return': float(returns.sum()) if days else 0.0,
+        'volatility': float(returns.std(ddof=1)) if days > 1 else 0.0,
+        'win_rate': float((returns > 0).mean()) if days else 0.0
+    }
+
+
 class MarketCorrelationAnalyzer:
     """
     Analyzes correlation between portfolio performance and SOL market trends.
@@ -56,15 +125,22 @@ class MarketCorrelationAnalyzer:
         self.slope_period = 3  # Days for slope calculation
         self.trend_threshold = 0.001  # 0.1% threshold for uptrend
         
+        self._last_raw_data: Dict[str, Any] = {}
+        # AIDEV-PERF-CLAUDE: bounded LRU of processed SOL indicator frames keyed by rates content + parameters
+        self._indicator_cache: "OrderedDict[tuple, pd.DataFrame]" = OrderedDict()
+        
         logger.info("Market Correlation Analyzer initialized")
         
-    def analyze_market_correlation(self, positions_df: pd.DataFrame, sol_rates: Dict[str, Optional[float]]) -> Dict[str, Any]:
+    def analyze_market_correlation(self, positions_df: pd.DataFrame, sol_rates: Dict[str, Optional[float]],
+                                   include_raw: bool = False) -> Dict[str, Any]:
         """
         Perform complete market correlation analysis using pre-fetched SOL rates.
         
         Args:
             positions_df (pd.DataFrame): Portfolio positions data.
             sol_rates (Dict[str, Optional[float]]): Pre-fetched SOL/USDC price data.
+            include_raw (bool): Embed the daily Series/DataFrame under 'raw_data' (needed by the
+                HTML correlation/EMA charts). Always available afterwards via get_last_raw_data().
             
         Returns:
             Dict[str, Any]: Complete correlation analysis results.
@@ -96,15 +172,22 @@ class MarketCorrelationAnalyzer:
             # Create two separate series: one for percentage returns (for correlation), one for absolute PnL (for trend analysis)
             portfolio_daily_returns = portfolio_daily_df.set_index('date')['daily_return']
             portfolio_daily_pnl = portfolio_daily_df.set_index('date')['daily_pnl_sol']
+            
+            # AIDEV-PERF-CLAUDE: align once here; the three analysis steps below receive plain aligned arrays.
+            portfolio_pos, sol_pos = _align_positions(portfolio_daily_returns.index, sol_daily.index)
+            aligned_returns = portfolio_daily_returns.to_numpy(dtype=np.float64).take(portfolio_pos)
+            aligned_pnl = portfolio_daily_pnl.to_numpy(dtype=np.float64).take(portfolio_pos)
+            aligned_sol_returns = sol_daily['daily_return'].to_numpy(dtype=np.float64).take(sol_pos)
+            aligned_uptrend = (sol_daily['trend'].to_numpy() == 'uptrend').take(sol_pos)
                 
-            # Step 3: Align data and calculate correlations (using percentage returns)
-            correlation_results = self._calculate_correlations(portfolio_daily_returns, sol_daily)
+            # Step 3: Calculate correlations (using percentage returns)
+            correlation_results = self._calculate_correlations(aligned_returns, aligned_sol_returns)
             
             # Step 4: Trend-based analysis (using absolute PnL in SOL)
-            trend_analysis = self._analyze_trend_performance(portfolio_daily_pnl, sol_daily)
+            trend_analysis = self._analyze_trend_performance(aligned_pnl, aligned_uptrend)
             
-            # Step 5: Statistical significance testing (using percentage returns)
-            significance_tests = self._calculate_statistical_significance(portfolio_daily_returns, sol_daily)
+            # Step 5: Statistical significance testing (reuses the correlation computed in step 3)
+            significance_tests = self._calculate_statistical_significance(correlation_results)
             
             # Compile complete analysis
             analysis_result = {
@@ -119,14 +202,18 @@ class MarketCorrelationAnalyzer:
                 },
                 'correlation_metrics': correlation_results,
                 'trend_analysis': trend_analysis,
-                'statistical_significance': significance_tests,
-                'raw_data': {
-                    'portfolio_daily_returns': portfolio_daily_returns,
-                    'sol_daily_data': sol_daily,
-                    # We no longer own the full sol_rates, so we reference it
-                    'sol_rates_source': 'Provided by orchestrator'
-                }
+                'statistical_significance': significance_tests
+            }
+            
+            # AIDEV-PERF-CLAUDE: raw frames are opt-in so scalar-only callers don't carry/serialize them.
+            self._last_raw_data = {
+                'portfolio_daily_returns': portfolio_daily_returns,
+                'sol_daily_data': sol_daily,
+                # We no longer own the full sol_rates, so we reference it
+                'sol_rates_source': 'Provided by orchestrator'
             }
+            if include_raw:
+                analysis_result['raw_data'] = self._last_raw_data
             
             logger.info("Market correlation analysis completed successfully")
             return analysis_result
@@ -135,6 +222,87 @@ class MarketCorrelationAnalyzer:
             logger.error(f"Market correlation analysis failed: {e}", exc_info=True)
             return {'error': str(e)}
         
+    def analyze_many(self, positions_by_strategy: Dict[str, pd.DataFrame],
+                     sol_rates: Dict[str, Optional[float]]) -> pd.DataFrame:
+        """
+        Batch correlation/trend analysis for several strategies sharing one SOL price history.
+        
+        Args:
+            positions_by_strategy (Dict[str, pd.DataFrame]): Positions data keyed by strategy name
+            sol_rates (Dict[str, Optional[float]]): Pre-fetched SOL/USDC price data
+            
+        Returns:
+            pd.DataFrame: One row per strategy with common_days, pearson_correlation, pearson_p_value,
+                uptrend/downtrend days and mean PnL, and Welch t_statistic / t_p_value (NaN where undefined)
+        """
+        columns = list(BATCH_STAT_COLUMNS) + ['pearson_p_value', 't_p_value']
+        strategies = list(positions_by_strategy)
+        sol_daily = self._process_sol_price_data(sol_rates) if sol_rates else pd.DataFrame()
+        if not strategies or sol_daily.empty:
+            return pd.DataFrame(columns=columns, index=pd.Index(strategies, name='strategy'), dtype=float)
+        
+        # AIDEV-PERF-CLAUDE: SOL indicators computed once; strategies stacked into [n_strategies, n_days]
+        # matrices (NaN = no trades that day) so the per-strategy statistics run as one parallel kernel.
+        returns_matrix = np.full((len(strategies), len(sol_daily)), np.nan)
+        pnl_matrix = np.full((len(strategies), len(sol_daily)), np.nan)
+        for row, strategy in enumerate(strategies):
+            positions_df = positions_by_strategy[strategy]
+            if positions_df.empty or 'close_timestamp' not in positions_df.columns:
+                continue
+            daily_df = calculate_daily_returns(positions_df)
+            if daily_df.empty:
+                continue
+            portfolio_pos, sol_pos = _align_positions(pd.DatetimeIndex(daily_df['date']), sol_daily.index)
+            returns_matrix[row, sol_pos] = daily_df['daily_return'].to_numpy(dtype=np.float64).take(portfolio_pos)
+            pnl_matrix[row, sol_pos] = daily_df['daily_pnl_sol'].to_numpy(dtype=np.float64).take(portfolio_pos)
+        
+        batch = batch_trend_stats(
+            returns_matrix, pnl_matrix,
+            sol_daily['daily_return'].to_numpy(dtype=np.float64),
+            sol_daily['trend'].to_numpy() == 'uptrend'
+        )
+        result = pd.DataFrame(batch, columns=list(BATCH_STAT_COLUMNS), index=pd.Index(strategies, name='strategy'))
+        
+        # p-values stay in SciPy (not callable from the kernel); same definitions as the single-portfolio path
+        n = result['common_days'].to_numpy()
+        r = result['pearson_correlation'].to_numpy()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            t_corr = r * np.sqrt((n - 2) / (1.0 - r * r))
+            pearson_p = 2 * stats.t.sf(np.abs(t_corr), n - 2)
+        result['pearson_p_value'] = np.where(n <= 2, np.where(np.isnan(r), np.nan, 1.0), pearson_p)
+        result['t_p_value'] = 2 * stats.t.sf(np.abs(result['t_statistic']), result['t_degrees_of_freedom'])
+        
+        logger.info(f"Batch market correlation analysis completed for {len(strategies)} strategies")
+        return result[columns]
+        
+    def build_raw_data(self, positions_df: pd.DataFrame, sol_rates: Dict[str, Optional[float]]) -> Dict[str, Any]:
+        """
+        Rebuild the 'raw_data' of an analysis result that was restored without it (e.g. from a disk cache).
+        
+        Args:
+            positions_df (pd.DataFrame): Positions the result was computed from
+            sol_rates (Dict[str, Optional[float]]): SOL/USDC prices the result was computed from
+            
+        Returns:
+            Dict[str, Any]: Same layout as analyze_market_correlation(include_raw=True)['raw_data']
+        """
+        portfolio_daily_df = calculate_daily_returns(positions_df)
+        self._last_raw_data = {
+            'portfolio_daily_returns': portfolio_daily_df.set_index('date')['daily_return'],
+            'sol_daily_data': self._process_sol_price_data(sol_rates),
+            'sol_rates_source': 'Provided by orchestrator'
+        }
+        return self._last_raw_data
+        
+    def get_last_raw_data(self) -> Dict[str, Any]:
+        """
+        Return the daily data behind the most recent successful analysis.
+        
+        Returns:
+            Dict[str, Any]: 'portfolio_daily_returns' Series and 'sol_daily_data' DataFrame (empty before first run)
+        """
+        return self._last_raw_data
+        
     def _process_sol_price_data(self, sol_rates: Dict[str, Optional[float]]) -> pd.DataFrame:
         """
         Process SOL price data and calculate technical indicators.
@@ -149,23 +317,34 @@ class MarketCorrelationAnalyzer:
             logger.warning("SOL price data is empty. Cannot process.")
             return pd.DataFrame()
             
-        valid_rates = {k: v for k, v in sol_rates.items() if v is not None}
-        if not valid_rates:
+        cache_key = (
+            hash(frozenset(sol_rates.items())), len(sol_rates),
+            self.ema_period, self.slope_period, self.trend_threshold
+        )
+        cached = self._indicator_cache.get(cache_key)
+        if cached is not None:
+            self._indicator_cache.move_to_end(cache_key)
+            logger.info(f"Reusing processed SOL price data for {len(cached)} days")
+            return cached
+            
+        rate_series = build_sol_rate_series(sol_rates)
+        if rate_series.empty:
             logger.warning("No valid SOL price data found after filtering. Cannot process.")
             return pd.DataFrame()
 
-        sol_df = pd.DataFrame(list(valid_rates.items()), columns=['date', 'close'])
-        sol_df['date'] = pd.to_datetime(sol_df['date'])
-        sol_df = sol_df.set_index('date').sort_index()
+        sol_df = rate_series.to_frame()
+        sol_df.index.name = 'date'
         
         sol_df['daily_return'] = sol_df['close'].pct_change()
         
         # AIDEV-NOTE-GEMINI: min_periods ensures EMA is calculated even if we have slightly less than 50 days of buffer.
-        sol_df['ema_50'] = sol_df['close'].ewm(span=self.ema_period, min_periods=min(self.ema_period, len(sol_df))).mean()
-        
-        sol_df['ema_slope'] = sol_df['ema_50'].pct_change(periods=self.slope_period)
+        ema, ema_slope = compute_ema_indicators(
+            sol_df['close'].to_numpy(), self.ema_period, min(self.ema_period, len(sol_df)), self.slope_period
+        )
+        sol_df['ema_50'] = ema
+        sol_df['ema_slope'] = ema_slope
         
-        sol_df['trend'] = np.where(sol_df['ema_slope'] > self.trend_threshold, 'uptrend', 'downtrend')
+        sol_df['trend'] = np.where(ema_slope > self.trend_threshold, 'uptrend', 'downtrend')
         
         sol_df = sol_df.dropna(subset=['daily_return', 'ema_slope'])
         
@@ -174,79 +353,58 @@ class MarketCorrelationAnalyzer:
         else:
             logger.warning("SOL price data became empty after processing and NaN removal.")
 
+        self._indicator_cache[cache_key] = sol_df
+        if len(self._indicator_cache) > _INDICATOR_CACHE_SIZE:
+            self._indicator_cache.popitem(last=False)
         return sol_df
         
-    def _calculate_correlations(self, portfolio_daily: pd.Series, sol_daily: pd.DataFrame) -> Dict[str, Any]:
+    def _calculate_correlations(self, portfolio_returns: np.ndarray, sol_returns: np.ndarray) -> Dict[str, Any]:
         """
         Calculate correlation metrics between portfolio and SOL returns.
         
         Args:
-            portfolio_daily (pd.Series): Portfolio daily returns
-            sol_daily (pd.DataFrame): SOL daily data
+            portfolio_returns (np.ndarray): Portfolio daily returns aligned to SOL dates
+            sol_returns (np.ndarray): SOL daily returns aligned to portfolio dates
             
         Returns:
             Dict[str, Any]: Correlation analysis results
         """
-        if sol_daily.empty:
-            return {'error': 'SOL daily data is empty.'}
-
-        common_dates = portfolio_daily.index.intersection(sol_daily.index)
+        common_days = portfolio_returns.size
         
-        if len(common_dates) < 2:
-            logger.warning(f"Only {len(common_dates)} common dates. Cannot calculate correlation.")
+        if common_days < 2:
+            logger.warning(f"Only {common_days} common dates. Cannot calculate correlation.")
             return {'error': 'Less than 2 common data points for correlation.'}
 
-        portfolio_aligned = portfolio_daily.loc[common_dates]
-        sol_aligned = sol_daily.loc[common_dates, 'daily_return']
-        
-        pearson_corr, pearson_p = stats.pearsonr(portfolio_aligned, sol_aligned)
+        pearson_corr, pearson_p = _pearson(portfolio_returns, sol_returns)
         
         return {
             'pearson_correlation': pearson_corr,
             'pearson_p_value': pearson_p,
             'is_significant': pearson_p < 0.05,
-            'common_days': len(common_dates),
-            'portfolio_volatility': portfolio_aligned.std(),
-            'sol_volatility': sol_aligned.std(),
-            'portfolio_mean_return': portfolio_aligned.mean(),
-            'sol_mean_return': sol_aligned.mean()
+            'common_days': common_days,
+            'portfolio_volatility': portfolio_returns.std(ddof=1),
+            'sol_volatility': sol_returns.std(ddof=1),
+            'portfolio_mean_return': portfolio_returns.mean(),
+            'sol_mean_return': sol_returns.mean()
         }
         
-    def _analyze_trend_performance(self, portfolio_daily: pd.Series, sol_daily: pd.DataFrame) -> Dict[str, Any]:
+    def _analyze_trend_performance(self, portfolio_pnl: np.ndarray, is_uptrend: np.ndarray) -> Dict[str, Any]:
         """
         Analyze portfolio performance during different SOL trend periods.
         
         Args:
-            portfolio_daily (pd.Series): Portfolio daily returns
-            sol_daily (pd.DataFrame): SOL daily data with trend classification
+            portfolio_pnl (np.ndarray): Portfolio daily PnL aligned to SOL dates
+            is_uptrend (np.ndarray): Boolean SOL uptrend flag for the same dates
             
         Returns:
             Dict[str, Any]: Trend-based performance analysis
         """
-        if sol_daily.empty: return {'error': 'SOL daily data is empty for trend analysis.'}
-        
-        common_dates = portfolio_daily.index.intersection(sol_daily.index)
-        portfolio_aligned = portfolio_daily.loc[common_dates]
-        sol_aligned = sol_daily.loc[common_dates]
-        
-        uptrend_mask = sol_aligned['trend'] == 'uptrend'
-        downtrend_mask = sol_aligned['trend'] == 'downtrend'
-        uptrend_returns = portfolio_aligned[uptrend_mask]
-        downtrend_returns = portfolio_aligned[downtrend_mask]
+        uptrend_returns = portfolio_pnl[is_uptrend]
+        downtrend_returns = portfolio_pnl[~is_uptrend]
         
         trend_analysis = {
-            'uptrend': {
-                'days': len(uptrend_returns),
-                'mean_return': uptrend_returns.mean() if len(uptrend_returns) > 0 else 0,
-                'total_return': uptrend_returns.sum() if len(uptrend_returns) > 0 else 0,
-                'win_rate': (uptrend_returns > 0).mean() if len(uptrend_returns) > 0 else 0
-            },
-            'downtrend': {
-                'days': len(downtrend_returns),
-                'mean_return': downtrend_returns.mean() if len(downtrend_returns) > 0 else 0,
-                'total_return': downtrend_returns.sum() if len(downtrend_returns) > 0 else 0,
-                'win_rate': (downtrend_returns > 0).mean() if len(downtrend_returns) > 0 else 0
-            }
+            'uptrend': _segment_stats(uptrend_returns),
+            'downtrend': _segment_stats(downtrend_returns)
         }
         
         if len(uptrend_returns) > 1 and len(downtrend_returns) > 1:
@@ -258,40 +416,37 @@ class MarketCorrelationAnalyzer:
                 'difference_is_significant': t_p_value < 0.05
             }
         
+        trend_days = is_uptrend.size
         trend_analysis['trend_distribution'] = {
-            'uptrend_percentage': (sol_aligned['trend'] == 'uptrend').mean() * 100,
-            'downtrend_percentage': (sol_aligned['trend'] == 'downtrend').mean() * 100
+            'uptrend_percentage': len(uptrend_returns) / trend_days * 100 if trend_days else float('nan'),
+            'downtrend_percentage': len(downtrend_returns) / trend_days * 100 if trend_days else float('nan')
         }
         
         return trend_analysis
         
-    def _calculate_statistical_significance(self, portfolio_daily: pd.Series, sol_daily: pd.DataFrame) -> Dict[str, Any]:
+    def _calculate_statistical_significance(self, correlation_results: Dict[str, Any]) -> Dict[str, Any]:
         """
         Calculate statistical significance tests for correlation analysis.
         
         Args:
-            portfolio_daily (pd.Series): Portfolio daily returns
-            sol_daily (pd.DataFrame): SOL daily data
+            correlation_results (Dict[str, Any]): Output of _calculate_correlations
+                (provides the Pearson coefficient, its p-value and the sample size)
             
         Returns:
             Dict[str, Any]: Statistical significance test results
         """
-        if sol_daily.empty: return {'error': 'SOL daily data is empty.'}
-
-        common_dates = portfolio_daily.index.intersection(sol_daily.index)
-        if len(common_dates) < 3: return {'error': 'Insufficient data for statistical testing (< 3 points)'}
+        n = correlation_results.get('common_days', 0)
+        if 'error' in correlation_results or n < 3:
+            return {'error': 'Insufficient data for statistical testing (< 3 points)'}
             
-        portfolio_aligned = portfolio_daily.loc[common_dates]
-        sol_aligned = sol_daily.loc[common_dates, 'daily_return']
-        
-        pearson_corr, pearson_p = stats.pearsonr(portfolio_aligned, sol_aligned)
+        pearson_corr = correlation_results['pearson_correlation']
+        pearson_p = correlation_results['pearson_p_value']
         
-        n = len(common_dates)
         if n <= 3: return {'error': f'Sample size ({n}) too small for confidence interval.'}
         
         z = np.arctanh(pearson_corr)
         se = 1 / np.sqrt(n - 3)
-        z_crit = stats.norm.ppf(0.975)  # 95% confidence
+        z_crit = _Z_95  # 95% confidence
         z_low, z_high = z - z_crit * se, z + z_crit * se
         corr_ci_low, corr_ci_high = np.tanh(z_low), np.tanh(z_high)
         
@@ -6,12 +6,22 @@ portfolio of trading positions, in both SOL and USDC denominations.
 """
 
 import logging
-from typing import Dict, Any, Optional
+import math
+from dataclasses import dataclass
+from typing import Dict, Any, Optional, Tuple
 import pandas as pd
 import numpy as np
 
+from reporting.metrics_kernel import drawdown_kernel, metrics_kernel
+
 logger = logging.getLogger(__name__)
 
+_SQRT_365 = math.sqrt(365.0)  # Daily -> annual Sharpe scaling
+
+# Position columns the metrics read (infrastructure_cost_sol is added by cost allocation, not the CSV).
+# Pass as `usecols` to load_and_prepare_positions when only metrics are needed.
+REQUIRED_COLUMNS = ('pnl_sol', 'investment_sol', 'open_timestamp', 'close_timestamp', 'infrastructure_cost_sol')
+
 # AIDEV-NOTE-CLAUDE: Moved this helper function to the top to fix 'reportUndefinedVariable' error.
 def _empty_metrics() -> Dict[str, float]:
     """Return empty metrics structure for edge cases."""
@@ -21,20 +31,303 @@ def _empty_metrics() -> Dict[str, float]:
         'net_pnl_after_costs': 0.0, 'total_positions': 0
     }
 
+def _close_days(positions_df: pd.DataFrame) -> pd.Series:
+    """
+    Get the calendar close day of every position as datetime64 values.
+
+    Args:
+        positions_df (pd.DataFrame): Positions with 'close_timestamp' (and optionally the cached 'close_day')
+
+    Returns:
+        pd.Series: Close timestamps normalized to midnight
+    """
+    if 'close_day' in positions_df.columns:
+        return positions_df['close_day']
+    return positions_df['close_timestamp'].dt.normalize()
+
+def _day_index(close_days: pd.Series) -> Tuple[np.ndarray, np.ndarray, pd.DatetimeIndex]:
+    """
+    Map every position to an integer calendar-day offset.
+
+    Args:
+        close_days (pd.Series): Close day per position (datetime64)
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, pd.DatetimeIndex]: (day offset per position, mask of offsets holding
+            at least one position, ascending dates of those occupied offsets)
+    """
+    days = close_days.to_numpy(dtype='datetime64[D]')
+    first_day = days.min()
+    day_codes = (days - first_day).astype(np.int64)
+    has_positions = np.bincount(day_codes) > 0
+    dates = (first_day + np.flatnonzero(has_positions)).astype('datetime64[ns]')
+    return day_codes, has_positions, pd.DatetimeIndex(dates, name='date')
+
+def _sum_by_day(close_days: pd.Series, values: np.ndarray) -> pd.Series:
+    """
+    Sum per-position values into calendar days.
+
+    Args:
+        close_days (pd.Series): Close day per position (datetime64)
+        values (np.ndarray): Value per position to aggregate (e.g. PnL)
+
+    Returns:
+        pd.Series: Daily sums indexed by date (ascending), only days with at least one position
+    """
+    # AIDEV-PERF-CLAUDE: scatter-add on integer day offsets (np.bincount) instead of a pandas groupby.
+    day_codes, has_positions, dates = _day_index(close_days)
+    sums = np.bincount(day_codes, weights=values)
+    return pd.Series(sums[has_positions], index=dates)
+
+def _pnl_stats(pnl: np.ndarray) -> Tuple[float, float, float]:
+    """
+    Calculate total PnL, win rate and profit factor of per-position PnL values.
+
+    Args:
+        pnl (np.ndarray): PnL per position (non-empty)
+
+    Returns:
+        Tuple[float, float, float]: (total_pnl, win_rate, profit_factor); profit factor is inf without losses
+    """
+    # AIDEV-PERF-CLAUDE: clipped sums avoid boolean-mask DataFrame slices (4 passes + 2 temporaries before).
+    positive_pnl = np.maximum(pnl, 0.0).sum(dtype=np.float64)
+    negative_pnl = -np.minimum(pnl, 0.0).sum(dtype=np.float64)
+    profit_factor = positive_pnl / negative_pnl if negative_pnl > 0 else float('inf')
+    return float(pnl.sum(dtype=np.float64)), float((pnl > 0).mean()), float(profit_factor)
+
+# AIDEV-QUESTION-CLAUDE: SOL Sharpe uses sample std (ddof=1), USDC uses population std (ddof=0) - kept as-is.
+def _sharpe_ratio(daily_returns: np.ndarray, risk_free_rate: float, ddof: int) -> float:
+    """
+    Calculate the annualized Sharpe ratio of daily returns.
+
+    Args:
+        daily_returns (np.ndarray): Daily portfolio returns
+        risk_free_rate (float): Annual risk-free rate (e.g. 0.05 for 5%)
+        ddof (int): Delta degrees of freedom for the standard deviation
+
+    Returns:
+        float: Annualized Sharpe ratio, 0.0 when fewer than 2 days or zero volatility
+    """
+    if daily_returns.size < 2:
+        return 0.0
+    # Subtracting a constant daily risk-free rate shifts the mean but not the std,
+    # so no excess-returns temporary is needed.
+    std = daily_returns.std(ddof=ddof)
+    if not std > 0:
+        return 0.0
+    return float((daily_returns.mean() - risk_free_rate / 365) / std * _SQRT_365)
+
+def _max_drawdown(cumulative: np.ndarray) -> float:
+    """
+    Calculate the maximum drawdown of a cumulative PnL curve.
+
+    Args:
+        cumulative (np.ndarray): Cumulative PnL per day, in date order
+
+    Returns:
+        float: Worst drawdown as a raw decimal (e.g. -0.5 for -50%); formatting is handled by the UI
+    """
+    if cumulative.size < 2:
+        return 0.0
+    if drawdown_kernel is not None:
+        # AIDEV-PERF-CLAUDE: compiled single scan, O(1) extra memory (no running-max/drawdown arrays)
+        return float(drawdown_kernel(np.ascontiguousarray(cumulative, dtype=np.float64)))
+    # AIDEV-PERF-CLAUDE: np.maximum.accumulate is a single C pass; replaces Series.expanding().max().
+    running_max = np.maximum.accumulate(cumulative)
+    # Using 1 for a zero peak prevents division by zero and handles the initial phase
+    # where peak PnL can be zero or negative.
+    peak = np.abs(running_max)
+    drawdown = (cumulative - running_max) / np.where(peak == 0, 1.0, peak)
+    if np.isnan(drawdown).all():
+        return 0.0
+    return float(np.nanmin(drawdown))
+
+def build_sol_rate_series(sol_rates: Dict[str, Optional[float]]) -> pd.Series:
+    """
+    Build a date-sorted SOL/USDC price Series from a rates dictionary.
+
+    Args:
+        sol_rates (Dict[str, Optional[float]]): SOL/USDC prices keyed by 'YYYY-MM-DD'; None marks a missing price
+
+    Returns:
+        pd.Series: Prices indexed by a sorted DatetimeIndex, missing prices dropped
+    """
+    # AIDEV-PERF-CLAUDE: one C-level array build; consumers share this instead of re-deriving from the dict.
+    if not sol_rates:
+        return pd.Series(dtype=np.float64, name='close')
+    prices = np.fromiter(
+        (np.nan if v is None else v for v in sol_rates.values()), dtype=np.float64, count=len(sol_rates)
+    )
+    dates = pd.to_datetime(list(sol_rates.keys()), format="%Y-%m-%d")
+    return pd.Series(prices, index=dates, name='close').dropna().sort_index()
+
+@dataclass(frozen=True)
+class PositionArrays:
+    """
+    Column-wise (structure-of-arrays) view of the positions consumed by the metrics functions.
+
+    Built once per analysis run so SOL and USDC metrics share the extracted columns and day index
+    instead of re-reading the DataFrame.
+
+    Attributes:
+        pnl_sol (np.ndarray): PnL per position (float32)
+        investment_sol (np.ndarray): Investment per position (float32)
+        infrastructure_cost_sol (Optional[np.ndarray]): Allocated cost per position (float32), None if not allocated
+        day_codes (np.ndarray): Close-day offset per position (from _day_index)
+        has_positions (np.ndarray): Mask of day offsets holding at least one position
+        dates (pd.DatetimeIndex): Ascending calendar days of the occupied offsets
+    """
+    pnl_sol: np.ndarray
+    investment_sol: np.ndarray
+    infrastructure_cost_sol: Optional[np.ndarray]
+    day_codes: np.ndarray
+    has_positions: np.ndarray
+    dates: pd.DatetimeIndex
+
+    @property
+    def n(self) -> int:
+        """Number of positions."""
+        return self.pnl_sol.size
+
+    @classmethod
+    def from_frame(cls, positions_df: pd.DataFrame) -> "PositionArrays":
+        """
+        Extract the metric columns of a non-empty positions DataFrame.
+
+        Args:
+            positions_df (pd.DataFrame): Positions with pnl_sol, investment_sol, close timestamps
+                and optionally infrastructure_cost_sol
+
+        Returns:
+            PositionArrays: Column arrays plus the shared close-day index
+        """
+        # AIDEV-PERF-CLAUDE: amounts narrowed to float32 here only (the loader keeps float64 for every other
+        # consumer) to halve bytes per pass; every reduction accumulates in float64 (kernel scalars, bincount
+        # weights, explicit dtype=np.float64).
+        day_codes, has_positions, dates = _day_index(_close_days(positions_df))
+        cost_sol = (positions_df['infrastructure_cost_sol'].to_numpy(dtype=np.float32)
+                    if 'infrastructure_cost_sol' in positions_df.columns else None)
+        return cls(
+            pnl_sol=positions_df['pnl_sol'].to_numpy(dtype=np.float32),
+            investment_sol=positions_df['investment_sol'].to_numpy(dtype=np.float32),
+            infrastructure_cost_sol=cost_sol,
+            day_codes=day_codes,
+            has_positions=has_positions,
+            dates=dates
+        )
+
+def _usdc_rates(day_codes: np.ndarray, first_day: np.datetime64, sol_rate_series: pd.Series,
+                fallback_price: float) -> np.ndarray:
+    """
+    Look up the SOL/USDC rate of every position's close day.
+
+    Args:
+        day_codes (np.ndarray): Day offset per position (from _day_index)
+        first_day (np.datetime64): Calendar day of offset 0
+        sol_rate_series (pd.Series): Prices from build_sol_rate_series
+        fallback_price (float): Price used (and logged once per date) when a day has no rate
+
+    Returns:
+        np.ndarray: Rate per position (float64)
+    """
+    # AIDEV-PERF-CLAUDE: dense rate table over the positions' day span, gathered by day offset - no hashing
+    # or date formatting per position (strftime only for the rare fallback warnings).
+    fx_table = np.full(int(day_codes.max()) + 1, np.nan)
+    rate_codes = (sol_rate_series.index.to_numpy(dtype='datetime64[D]') - np.datetime64(first_day, 'D')).astype(np.int64)
+    in_span = (rate_codes >= 0) & (rate_codes < fx_table.size)
+    fx_table[rate_codes[in_span]] = sol_rate_series.to_numpy(dtype=np.float64)[in_span]
+
+    missing_codes = np.flatnonzero(np.isnan(fx_table) & (np.bincount(day_codes, minlength=fx_table.size) > 0))
+    for missing_day in np.datetime64(first_day, 'D') + missing_codes:
+        logger.warning(f"Using fallback price ${fallback_price} for {missing_day} in USDC metrics calculation.")
+    fx_table[np.isnan(fx_table)] = fallback_price
+    return fx_table[day_codes]
+
+def _metrics_dict(total_key: str, total_pnl: float, win_rate: float, profit_factor: float, sharpe_ratio: float,
+                  max_drawdown: float, total_cost: float, total_positions: int) -> Dict[str, float]:
+    """Lay out one denomination's metrics in the calculate_sol_metrics / calculate_usdc_metrics format."""
+    return {
+        total_key: total_pnl, 'sharpe_ratio': sharpe_ratio,
+        'max_drawdown_percent': max_drawdown, 'win_rate': win_rate,
+        'profit_factor': profit_factor, 'net_pnl_after_costs': total_pnl - total_cost,
+        'cost_impact_percent': (total_cost / abs(total_pnl) * 100) if total_pnl != 0 else 0,
+        'total_positions': total_positions
+    }
+
+def _denomination_metrics(total_key: str, pnl: np.ndarray, daily_returns: np.ndarray, cumulative: np.ndarray,
+                          total_cost: float, risk_free_rate: float, ddof: int) -> Dict[str, float]:
+    """
+    Assemble the metrics dictionary of one denomination from plain arrays.
+
+    Args:
+        total_key (str): Key for total PnL ('total_pnl_sol' or 'total_pnl_usdc')
+        pnl (np.ndarray): PnL per position
+        daily_returns (np.ndarray): Daily returns in date order
+        cumulative (np.ndarray): Cumulative daily PnL in date order
+        total_cost (float): Total infrastructure cost in the same denomination
+        risk_free_rate (float): Annual risk-free rate for the Sharpe ratio
+        ddof (int): Degrees of freedom for the Sharpe standard deviation
+
+    Returns:
+        Dict[str, float]: Metrics in the calculate_sol_metrics / calculate_usdc_metrics layout
+    """
+    total_pnl, win_rate, profit_factor = _pnl_stats(pnl)
+    return _metrics_dict(
+        total_key, total_pnl, win_rate, profit_factor, _sharpe_ratio(daily_returns, risk_free_rate, ddof),
+        _max_drawdown(cumulative), total_cost, pnl.size
+    )
+
+def _denomination_pass(total_key: str, pnl: np.ndarray, day_codes: np.ndarray, has_positions: np.ndarray,
+                       capital_base: float, total_cost: float, risk_free_rate: float,
+                       ddof: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray, Dict[str, float]]:
+    """
+    Roll one denomination up to days and compute its metrics.
+
+    Args:
+        total_key (str): Key for total PnL ('total_pnl_sol' or 'total_pnl_usdc')
+        pnl (np.ndarray): PnL per position (float64)
+        day_codes (np.ndarray): Day offset per position (from _day_index)
+        has_positions (np.ndarray): Occupied-offset mask (from _day_index)
+        capital_base (float): Divisor for daily returns; 0 yields zero returns
+        total_cost (float): Total infrastructure cost in the same denomination
+        risk_free_rate (float): Annual risk-free rate for the Sharpe ratio
+        ddof (int): Degrees of freedom for the Sharpe standard deviation
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray, Dict[str, float]]: (daily PnL, cumulative PnL,
+            daily returns, metrics) over occupied days
+    """
+    if metrics_kernel is not None:
+        daily, cumulative, total_pnl, win_rate, profit_factor, sharpe_ratio, max_drawdown = metrics_kernel(
+            pnl, day_codes, has_positions.size, float(capital_base), float(risk_free_rate), ddof
+        )
+        daily_returns = daily / capital_base if capital_base != 0 else np.zeros_like(daily)
+        metrics = _metrics_dict(total_key, float(total_pnl), float(win_rate), float(profit_factor),
+                                float(sharpe_ratio), float(max_drawdown), total_cost, pnl.size)
+        return daily, cumulative, daily_returns, metrics
+
+    daily = np.bincount(day_codes, weights=pnl)[has_positions]
+    cumulative = np.cumsum(daily)
+    daily_returns = daily / capital_base if capital_base != 0 else np.zeros_like(daily)
+    metrics = _denomination_metrics(total_key, pnl, daily_returns, cumulative, total_cost, risk_free_rate, ddof)
+    return daily, cumulative, daily_returns, metrics
+
 def calculate_daily_returns(positions_df: pd.DataFrame) -> pd.DataFrame:
     """Calculate daily portfolio returns from positions."""
     if positions_df.empty:
         return pd.DataFrame()
 
-    daily_pnl = positions_df.groupby(positions_df['close_timestamp'].dt.date)['pnl_sol'].sum()
-    daily_df = daily_pnl.reset_index()
-    daily_df.columns = ['date', 'daily_pnl_sol']
-    daily_df['date'] = pd.to_datetime(daily_df['date'])
-    daily_df = daily_df.sort_values('date').reset_index(drop=True)
-    daily_df['cumulative_pnl_sol'] = daily_df['daily_pnl_sol'].cumsum()
+    daily_pnl = _sum_by_day(_close_days(positions_df), positions_df['pnl_sol'].to_numpy(dtype=np.float64))
+    # AIDEV-PERF-CLAUDE: _sum_by_day already yields ascending datetime64 days - no re-sort, re-parse or frame copies.
+    daily_values = daily_pnl.to_numpy()
+    daily_df = pd.DataFrame({
+        'date': daily_pnl.index.to_numpy(),
+        'daily_pnl_sol': daily_values,
+        'cumulative_pnl_sol': np.cumsum(daily_values)
+    })
 
     # Estimate capital base for return calculation
-    avg_investment = positions_df['investment_sol'].mean() if not positions_df.empty else 1.0
+    avg_investment = positions_df['investment_sol'].to_numpy().mean(dtype=np.float64) if not positions_df.empty else 1.0
     estimated_capital_base = avg_investment * len(positions_df) if not positions_df.empty else 1.0
     daily_df['daily_return'] = daily_df['daily_pnl_sol'] / estimated_capital_base
 
@@ -45,147 +338,107 @@ def calculate_sol_metrics(positions_df: pd.DataFrame, daily_df: pd.DataFrame, ri
     if positions_df.empty or daily_df.empty:
         return _empty_metrics()
 
-    total_pnl_sol = positions_df['pnl_sol'].sum()
-    win_rate = (positions_df['pnl_sol'] > 0).mean()
-
-    positive_pnl = positions_df[positions_df['pnl_sol'] > 0]['pnl_sol'].sum()
-    negative_pnl = abs(positions_df[positions_df['pnl_sol'] < 0]['pnl_sol'].sum())
-    profit_factor = positive_pnl / negative_pnl if negative_pnl > 0 else float('inf')
+    total_cost_sol = positions_df['infrastructure_cost_sol'].to_numpy().sum(dtype=np.float64) if 'infrastructure_cost_sol' in positions_df.columns else 0
+    # AIDEV-NOTE-CLAUDE: cost_impact_percent key (previously missing) is produced by _denomination_metrics
+    return _denomination_metrics(
+        'total_pnl_sol', positions_df['pnl_sol'].to_numpy(dtype=np.float64),
+        daily_df['daily_return'].to_numpy(dtype=np.float64),
+        daily_df['cumulative_pnl_sol'].to_numpy(dtype=np.float64),
+        total_cost_sol, risk_free_rate, ddof=1
+    )
 
-    # Sharpe ratio
-    sharpe_ratio = 0.0
-    if len(daily_df) > 1 and daily_df['daily_return'].std() > 0:
-        daily_returns = daily_df['daily_return']
-        risk_free_daily = risk_free_rate / 365
-        excess_returns = daily_returns - risk_free_daily
-        sharpe_ratio = excess_returns.mean() / excess_returns.std() * np.sqrt(365)
-
-    # Max drawdown
-    max_drawdown = 0.0
-    if len(daily_df) > 1:
-        cumulative = daily_df['cumulative_pnl_sol']
-        running_max = cumulative.expanding().max()
-        # Using .replace(0, 1) on the absolute value of the peak prevents division by zero
-        # and handles the initial phase where peak PnL can be zero or negative. This is the most
-        # robust and simple way to ensure calculation stability.
-        safe_running_max = running_max.abs().replace(0, 1)
-        drawdown = (cumulative - running_max) / safe_running_max
-        # The metric should return a raw decimal value. Formatting is handled by the UI.
-        max_drawdown = drawdown.min() if not drawdown.empty and not drawdown.isnull().all() else 0.0
-
-    # Net PnL and Cost Impact
-    total_cost_sol = positions_df['infrastructure_cost_sol'].sum() if 'infrastructure_cost_sol' in positions_df.columns else 0
-    net_pnl_sol = total_pnl_sol - total_cost_sol
-    cost_impact_percent = (total_cost_sol / abs(total_pnl_sol) * 100) if total_pnl_sol != 0 else 0
+def _usdc_metrics(positions: PositionArrays, sol_rate_series: pd.Series, risk_free_rate: float) -> Dict[str, float]:
+    """
+    Calculate USDC-denominated metrics from position arrays.
 
-    return {
-        'total_pnl_sol': total_pnl_sol, 'sharpe_ratio': sharpe_ratio,
-        'max_drawdown_percent': max_drawdown, 'win_rate': win_rate,
-        'profit_factor': profit_factor, 'net_pnl_after_costs': net_pnl_sol,
-        'cost_impact_percent': cost_impact_percent, # AIDEV-NOTE-CLAUDE: Added missing key
-        'total_positions': len(positions_df)
-    }
+    Args:
+        positions (PositionArrays): Non-empty position columns
+        sol_rate_series (pd.Series): Prices from build_sol_rate_series
+        risk_free_rate (float): Annual USDC risk-free rate
 
-def calculate_usdc_metrics(positions_df: pd.DataFrame, sol_rates: Dict[str, Any], risk_free_rate: float) -> Dict[str, float]:
-    """Calculate portfolio metrics in USDC denomination."""
-    if positions_df.empty:
-        return _empty_metrics()
-
-    positions_usdc = positions_df.copy()
+    Returns:
+        Dict[str, float]: USDC metrics
+    """
     fallback_price = 150.0
 
-    def get_safe_rate(date_str):
-        rate = sol_rates.get(date_str)
-        if rate is None:
-            if not hasattr(get_safe_rate, 'logged_warnings'):
-                get_safe_rate.logged_warnings = set()
-            if date_str not in get_safe_rate.logged_warnings:
-                logger.warning(f"Using fallback price ${fallback_price} for {date_str} in USDC metrics calculation.")
-                get_safe_rate.logged_warnings.add(date_str)
-            return fallback_price
-        return rate
-
-    positions_usdc['pnl_usdc'] = positions_usdc.apply(
-        lambda row: row['pnl_sol'] * get_safe_rate(row['close_timestamp'].strftime("%Y-%m-%d")),
-        axis=1
-    )
-    if 'infrastructure_cost_sol' in positions_usdc.columns:
-        positions_usdc['infrastructure_cost_usdc'] = positions_usdc.apply(
-            lambda row: row['infrastructure_cost_sol'] * get_safe_rate(row['close_timestamp'].strftime("%Y-%m-%d")),
-            axis=1
-        )
-    else:
-        positions_usdc['infrastructure_cost_usdc'] = 0.0
-
-    daily_pnl_usdc = positions_usdc.groupby(positions_usdc['close_timestamp'].dt.date)['pnl_usdc'].sum()
-    daily_usdc_df = daily_pnl_usdc.reset_index()
-    daily_usdc_df.columns = ['date', 'daily_pnl_usdc']
-    daily_usdc_df['date'] = pd.to_datetime(daily_usdc_df['date'])
-    daily_usdc_df['cumulative_pnl_usdc'] = daily_usdc_df['daily_pnl_usdc'].cumsum()
-
-    avg_investment_sol = positions_df['investment_sol'].mean() if not positions_df.empty else 1.0
-    
-    valid_rates = [r for r in sol_rates.values() if r is not None]
-    avg_sol_price = np.mean(valid_rates) if valid_rates else fallback_price
-    
-    estimated_capital_base_usdc = avg_investment_sol * len(positions_df) * avg_sol_price
-    
-    if estimated_capital_base_usdc != 0:
-        daily_usdc_df['daily_return'] = daily_usdc_df['daily_pnl_usdc'] / estimated_capital_base_usdc
-    else:
-        daily_usdc_df['daily_return'] = 0.0
-
-    total_pnl_usdc = positions_usdc['pnl_usdc'].sum()
-    win_rate = (positions_usdc['pnl_usdc'] > 0).mean() if not positions_usdc.empty else 0.0
-
-    positive_pnl = positions_usdc[positions_usdc['pnl_usdc'] > 0]['pnl_usdc'].sum()
-    negative_pnl = abs(positions_usdc[positions_usdc['pnl_usdc'] < 0]['pnl_usdc'].sum())
-    profit_factor = positive_pnl / negative_pnl if negative_pnl > 0 else float('inf')
+    # AIDEV-PERF-CLAUDE: USDC values live in local arrays only - no positions_df.copy() just to hold two
+    # derived columns that were never returned.
+    rates = _usdc_rates(positions.day_codes, positions.dates[0], sol_rate_series, fallback_price)
+    pnl_usdc = positions.pnl_sol * rates
 
-    sharpe_ratio = 0.0
-    if len(daily_usdc_df) > 1 and daily_usdc_df['daily_return'].std(ddof=0) > 0:
-        daily_returns = daily_usdc_df['daily_return']
-        risk_free_daily = risk_free_rate / 365
-        excess_returns = daily_returns - risk_free_daily
-        sharpe_ratio = excess_returns.mean() / excess_returns.std(ddof=0) * np.sqrt(365)
-
-    max_drawdown = 0.0
-    if len(daily_usdc_df) > 1:
-        cumulative = daily_usdc_df['cumulative_pnl_usdc']
-        running_max = cumulative.expanding().max()
-        # Using .replace(0, 1) on the absolute value of the peak prevents division by zero
-        # and handles the initial phase where peak PnL can be zero or negative.
-        safe_running_max = running_max.abs().replace(0, 1)
-        drawdown = (cumulative - running_max) / safe_running_max
-        # The metric should return a raw decimal value (e.g., -0.5 for -50%).
-        # The final formatting to a percentage string happens in the reporting layer.
-        max_drawdown = drawdown.min() if not drawdown.empty and not drawdown.isnull().all() else 0.0
-
-    total_cost_usdc = positions_usdc['infrastructure_cost_usdc'].sum()
-    net_pnl_usdc = total_pnl_usdc - total_cost_usdc
-
-    cost_impact_percent = (total_cost_usdc / abs(total_pnl_usdc) * 100) if total_pnl_usdc != 0 else 0
+    # AIDEV-PERF-CLAUDE: missing rates fall back to a price, never zero - the skippable case is an all-zero cost
+    # column (allocation failed or disabled), where the USDC cost is zero without a multiply.
+    cost_sol = positions.infrastructure_cost_sol
+    total_cost_usdc = cost_sol.dot(rates) if cost_sol is not None and cost_sol.any() else 0.0
 
-    return {
-        'total_pnl_usdc': total_pnl_usdc, 'sharpe_ratio': sharpe_ratio,
-        'max_drawdown_percent': max_drawdown, 'win_rate': win_rate,
-        'profit_factor': profit_factor, 'net_pnl_after_costs': net_pnl_usdc,
-        'cost_impact_percent': cost_impact_percent,
-        'total_positions': len(positions_usdc)
-    }
+    avg_sol_price = sol_rate_series.mean() if not sol_rate_series.empty else fallback_price
+    estimated_capital_base_usdc = positions.investment_sol.mean(dtype=np.float64) * positions.n * avg_sol_price
 
-def calculate_currency_comparison(sol_rates: Dict[str, Any], sol_metrics: Dict[str, float], usdc_metrics: Dict[str, float], positions_df: pd.DataFrame) -> Dict[str, Any]:
-    """Calculate currency comparison metrics."""
-    valid_rates_list = sorted([item for item in sol_rates.items() if item[1] is not None])
+    _, _, _, usdc_metrics = _denomination_pass(
+        'total_pnl_usdc', pnl_usdc, positions.day_codes, positions.has_positions, estimated_capital_base_usdc,
+        total_cost_usdc, risk_free_rate, ddof=0
+    )
+    return usdc_metrics
 
+def calculate_usdc_metrics(positions_df: pd.DataFrame, sol_rate_series: pd.Series, risk_free_rate: float) -> Dict[str, float]:
+    """Calculate portfolio metrics in USDC denomination (rates from build_sol_rate_series)."""
+    if positions_df.empty:
+        return _empty_metrics()
+    return _usdc_metrics(PositionArrays.from_frame(positions_df), sol_rate_series, risk_free_rate)
+
+def calculate_portfolio_metrics(positions: PositionArrays, sol_rate_series: pd.Series,
+                                risk_free_rates: Dict[str, float],
+                                include_usdc: bool = True) -> Tuple[pd.DataFrame, Dict[str, float], Dict[str, float]]:
+    """
+    Calculate daily returns plus SOL and USDC metrics from one set of position arrays.
+
+    Equivalent to calculate_daily_returns + calculate_sol_metrics + calculate_usdc_metrics, but the
+    position columns and day offsets are extracted once (PositionArrays.from_frame) and shared.
+
+    Args:
+        positions (PositionArrays): Position columns, built once per analysis run
+        sol_rate_series (pd.Series): Prices from build_sol_rate_series
+        risk_free_rates (Dict[str, float]): 'sol_staking' and 'usdc_staking' annual rates
+        include_usdc (bool): When False the USDC pass (rate gather, rollup, drawdown) is skipped
+            and empty USDC metrics are returned
+
+    Returns:
+        Tuple[pd.DataFrame, Dict[str, float], Dict[str, float]]: (daily SOL returns frame, SOL metrics, USDC metrics)
+    """
+    if positions.n == 0:
+        return pd.DataFrame(), _empty_metrics(), _empty_metrics()
+
+    cost_sol = positions.infrastructure_cost_sol
+    total_cost_sol = cost_sol.sum(dtype=np.float64) if cost_sol is not None else 0
+    capital_base_sol = positions.investment_sol.mean(dtype=np.float64) * positions.n
+
+    # AIDEV-PERF-CLAUDE: both denominations roll up over the same day offsets (Numba kernel when available).
+    daily_pnl_sol, cumulative_sol, daily_return_sol, sol_metrics = _denomination_pass(
+        'total_pnl_sol', positions.pnl_sol, positions.day_codes, positions.has_positions, capital_base_sol,
+        total_cost_sol, risk_free_rates['sol_staking'], ddof=1
+    )
+    usdc_metrics = (_usdc_metrics(positions, sol_rate_series, risk_free_rates['usdc_staking'])
+                    if include_usdc else _empty_metrics())
+
+    daily_df = pd.DataFrame({
+        'date': positions.dates.to_numpy(),
+        'daily_pnl_sol': daily_pnl_sol,
+        'cumulative_pnl_sol': cumulative_sol,
+        'daily_return': daily_return_sol
+    })
+    return daily_df, sol_metrics, usdc_metrics
+
+def calculate_currency_comparison(sol_rate_series: pd.Series, sol_metrics: Dict[str, float], usdc_metrics: Dict[str, float], positions_df: pd.DataFrame) -> Dict[str, Any]:
+    """Calculate currency comparison metrics (rates from build_sol_rate_series, already date-sorted)."""
     sol_price_change = 0.0
-    if len(valid_rates_list) >= 2:
-        start_price = valid_rates_list[0][1]
-        end_price = valid_rates_list[-1][1]
-        if start_price is not None and start_price > 0:
+    if len(sol_rate_series) >= 2:
+        # The Series is sorted by date, so the period endpoints are O(1) positional lookups
+        start_price = sol_rate_series.iloc[0]
+        end_price = sol_rate_series.iloc[-1]
+        if start_price > 0:
             sol_price_change = (end_price - start_price) / start_price * 100
 
-    total_investment_sol = positions_df['investment_sol'].sum() if not positions_df.empty else 1.0
+    total_investment_sol = positions_df['investment_sol'].to_numpy().sum(dtype=np.float64) if not positions_df.empty else 1.0
     lp_return_pct = (sol_metrics.get('total_pnl_sol', 0) / total_investment_sol * 100) if total_investment_sol > 0 else 0
     outperformance = lp_return_pct - sol_price_change
 
@@ -5,38 +5,70 @@ Coordinates the complete portfolio analysis workflow by integrating various
 analysis components and generating comprehensive reports.
 """
 
+import hashlib
 import logging
 import os
 import sys
-import yaml
+import threading
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Dict, Any, Tuple, List, Optional
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Any, Callable, Tuple, List, Optional
 
 # AIDEV-NOTE-CLAUDE: This ensures project root is on the path for module resolution
-# Corrected path to handle nested structure
-project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-if project_root not in sys.path:
-    sys.path.append(project_root)
+# Corrected path to handle nested structure. Resolved once at import; the guard keeps re-imports from growing sys.path.
+_PROJECT_ROOT = str(Path(__file__).resolve().parents[2])
+if _PROJECT_ROOT not in sys.path:
+    sys.path.append(_PROJECT_ROOT)
+
+# Default config located next to this module, independent of the working directory
+_DEFAULT_CONFIG_PATH = str(Path(__file__).resolve().parent / "config" / "portfolio_config.yaml")
 
 from reporting.portfolio_analytics import PortfolioAnalytics
-from reporting.chart_generator import ChartGenerator
-from reporting.market_correlation_analyzer import MarketCorrelationAnalyzer
-from reporting.html_report_generator import HTMLReportGenerator
 from reporting.data_loader import load_and_prepare_positions
+from reporting.metrics_calculator import REQUIRED_COLUMNS
+from reporting.metrics_kernel import warm_up_kernels
+from reporting.report_writer import ReportWriter
+from reporting.result_cache import ResultCache, compute_inputs_key
 from reporting.text_reporter import generate_portfolio_and_cost_reports, generate_weekend_simulation_report
-from simulations.weekend_simulator import WeekendSimulator
-from reporting.strategy_instance_detector import run_instance_detection
-from reporting.analysis_runner import AnalysisRunner
+from utils.common import load_yaml_config
+# AIDEV-PERF-CLAUDE: chart (matplotlib/seaborn), correlation (scipy), HTML (plotly), weekend, instance-detection
+# and strategy-simulation modules are imported where used - run_quick_analysis never loads them.
 
 logger = logging.getLogger(__name__)
 
+
+# AIDEV-PERF-CLAUDE: prepared positions memoized per (file, mtime, threshold, projection) for the whole process;
+# a touched file gets a new mtime and therefore a fresh entry. Callers get copies via _load_positions.
+@lru_cache(maxsize=8)
+def _cached_load(abs_path: str, mtime: float, min_threshold: float,
+                 usecols: Optional[Tuple[str, ...]], engine: str) -> pd.DataFrame:
+    """Load positions once per unique file version (mtime only participates in the cache key)."""
+    return load_and_prepare_positions(abs_path, min_threshold, usecols=usecols, engine=engine)
+
+
+# AIDEV-PERF-CLAUDE: close-time ordered view of a cached load, sorted once per file version - repeated period
+# analyses binary-search it instead of re-sorting the frame on every call.
+@lru_cache(maxsize=4)
+def _cached_sorted_load(abs_path: str, mtime: float, min_threshold: float,
+                        usecols: Optional[Tuple[str, ...]], engine: str) -> pd.DataFrame:
+    """_cached_load ordered by close_timestamp (stable, so same-time positions keep file order)."""
+    positions_df = _cached_load(abs_path, mtime, min_threshold, usecols, engine)
+    if positions_df['close_timestamp'].is_monotonic_increasing:
+        return positions_df
+    return positions_df.sort_values('close_timestamp', kind='mergesort')
+
+
 class PortfolioAnalysisOrchestrator:
     """Main orchestrator for complete portfolio analysis workflow."""
     
-    def __init__(self, config_path: str = "reporting/config/portfolio_config.yaml", api_key: Optional[str] = None):
+    def __init__(self, config_path: str = _DEFAULT_CONFIG_PATH, api_key: Optional[str] = None):
         """Initialize orchestrator."""
         self.config_path = config_path
         self.config = self._load_config()
+        self._timestamp_format = self.config.get('visualization', {}).get('timestamp_format', '%Y%m%d_%H%M%S')
         # AIDEV-NOTE-CLAUDE: API key is now passed during initialization.
         self.api_key = api_key
         if not self.api_key:
@@ -44,19 +76,169 @@ class PortfolioAnalysisOrchestrator:
         
         # AIDEV-NOTE-CLAUDE: Pass the API key to downstream analytics modules.
         self.analytics = PortfolioAnalytics(self.config_path, api_key=self.api_key)
-        self.chart_generator = ChartGenerator(self.config_path)
+        # AIDEV-PERF-CLAUDE: analysis components are built once per orchestrator (config read, HTTP/cache
+        # managers initialised once) and reused by every run; the lock covers first use from worker threads.
+        self._components_lock = threading.Lock()
+        self._chart_generator = None
+        self._correlation_analyzer = None
+        self._weekend_simulator = None
+        self._html_generator = None
+        self._strategy_runner = None
         self.output_dir = "reporting/output"
+        self._result_cache = ResultCache(self.output_dir)
+        # AIDEV-PERF-CLAUDE: text reports are written in the background so disk flushes overlap with
+        # charts/HTML rendering; every public entry point joins them (flush/drop_failed) before returning.
+        # Pools are created on first use (see _pool) and shut down by close() / the context manager.
+        self._report_writer = ReportWriter()
+        self._step_pool: Optional[ThreadPoolExecutor] = None
+        self._chart_pool: Optional[ThreadPoolExecutor] = None
         logger.info("Portfolio Analysis Orchestrator initialized")
         
+    def __enter__(self) -> "PortfolioAnalysisOrchestrator":
+        return self
+        
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+        
+    def __del__(self):
+        # Safety net only - callers are expected to use the context manager or close()
+        for pool_attr in ('_step_pool', '_chart_pool'):
+            pool = getattr(self, pool_attr, None)
+            if pool is not None:
+                pool.shutdown(wait=False)
+        if hasattr(self, '_report_writer'):
+            self._report_writer.close(wait=False)
+        
+    def close(self) -> None:
+        """Finish pending report writes and shut down any pools created so far (they are recreated on reuse)."""
+        self._report_writer.close()
+        for pool_attr in ('_step_pool', '_chart_pool'):
+            pool = getattr(self, pool_attr)
+            if pool is not None:
+                pool.shutdown(wait=True)
+                setattr(self, pool_attr, None)
+        
+    def _pool(self, attr: str, max_workers: int, name: str) -> ThreadPoolExecutor:
+        """Thread pool stored in attr, created on first use (runs that never need it spawn no threads)."""
+        return self._shared_component(
+            attr, lambda: ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=name)
+        )
+        
+    def _shared_component(self, attr: str, factory):
+        """Return the component cached in attr, building it with factory() on first use (thread-safe)."""
+        component = getattr(self, attr)
+        if component is None:
+            with self._components_lock:
+                component = getattr(self, attr)
+                if component is None:
+                    component = factory()
+                    setattr(self, attr, component)
+        return component
+        
+    @property
+    def chart_generator(self):
+        """ChartGenerator, created (and matplotlib imported) on first use."""
+        def build():
+            from reporting.chart_generator import ChartGenerator
+            return ChartGenerator(self.config_path)
+        return self._shared_component('_chart_generator', build)
+        
+    @property
+    def correlation_analyzer(self):
+        """MarketCorrelationAnalyzer, created (and scipy imported) on first use."""
+        def build():
+            from reporting.market_correlation_analyzer import MarketCorrelationAnalyzer
+            return MarketCorrelationAnalyzer(self.config_path, api_key=self.api_key)
+        return self._shared_component('_correlation_analyzer', build)
+        
+    @property
+    def weekend_simulator(self):
+        """WeekendSimulator, created on first use."""
+        def build():
+            from simulations.weekend_simulator import WeekendSimulator
+            return WeekendSimulator(self.config_path)
+        return self._shared_component('_weekend_simulator', build)
+        
+    @property
+    def html_generator(self):
+        """HTMLReportGenerator, created (and plotly/jinja imported) on first use."""
+        def build():
+            from reporting.html_report_generator import HTMLReportGenerator
+            return HTMLReportGenerator(config=self.config)
+        return self._shared_component('_html_generator', build)
+        
+    @property
+    def strategy_runner(self):
+        """AnalysisRunner for Spot vs. Bid-Ask simulations, created on first use."""
+        def build():
+            from reporting.analysis_runner import AnalysisRunner
+            return AnalysisRunner(api_key=self.api_key, config=self.config)
+        return self._shared_component('_strategy_runner', build)
+        
     def _load_config(self) -> Dict:
-        """Load YAML configuration."""
+        """Load YAML configuration (cached until the file changes)."""
         try:
-            with open(self.config_path, 'r') as f:
-                return yaml.safe_load(f)
+            return load_yaml_config(self.config_path)
         except FileNotFoundError:
             logger.warning(f"Config file not found: {self.config_path}, using defaults")
             return {}
 
+    def _load_positions(self, positions_file: str, usecols: Optional[Tuple[str, ...]] = None,
+                        copy: bool = True, sort_by_close: bool = False) -> pd.DataFrame:
+        """
+        Load and prepare positions, reusing the previous result while the file is unchanged.
+        
+        Args:
+            positions_file (str): Path to positions CSV
+            usecols (Optional[Tuple[str, ...]]): Column projection passed to the loader (None = all columns)
+            copy (bool): Return a private copy. False hands out the cached frame itself - only for
+                callers that never modify it (or derive a new frame first)
+            sort_by_close (bool): Return the positions ordered by close_timestamp (sorted once per file version)
+            
+        Returns:
+            pd.DataFrame: Prepared positions
+        """
+        engine = self.config.get('io', {}).get('engine', 'pandas')
+        abs_path = os.path.abspath(positions_file)
+        try:
+            mtime = os.path.getmtime(abs_path)
+        except OSError:
+            # Let the loader report the missing file as before
+            positions_df = load_and_prepare_positions(positions_file, self.analytics.min_threshold,
+                                                      usecols=usecols, engine=engine)
+            return positions_df.sort_values('close_timestamp', kind='mergesort') if sort_by_close else positions_df
+        
+        loader = _cached_sorted_load if sort_by_close else _cached_load
+        hits_before = loader.cache_info().hits
+        positions_df = loader(abs_path, mtime, self.analytics.min_threshold, usecols, engine)
+        if loader.cache_info().hits > hits_before:
+            logger.info(f"Reusing loaded positions for {positions_file} (file unchanged)")
+        return positions_df.copy() if copy else positions_df
+
+    def _inputs_key(self, positions_file: str) -> Optional[str]:
+        """Result-cache key of an analysis of positions_file under this orchestrator's config (see compute_inputs_key)."""
+        return compute_inputs_key(positions_file, self.config_path, self.analytics.min_threshold, bool(self.api_key))
+
+    def _cached_analysis(self, positions_file: str, now: datetime,
+                         compute: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Return the portfolio analysis (without raw_data) from the result cache, or compute and store it.
+        
+        AIDEV-PERF-CLAUDE: a hit (same _inputs_key) skips the CSV load, rate lookup and metric pipeline.
+        
+        Args:
+            positions_file (str): Path to positions CSV
+            now (datetime): Run timestamp, stamped into 'generated_timestamp' (also on a hit)
+            compute (Callable[[], Dict[str, Any]]): Loads and analyzes on a miss; error results aren't stored
+            
+        Returns:
+            Dict[str, Any]: Analysis result
+        """
+        result = self._result_cache.cached('analysis', self._inputs_key(positions_file), compute)
+        if 'analysis_metadata' in result:
+            result['analysis_metadata']['generated_timestamp'] = now.isoformat()
+        return result
+
     def _should_skip_weekend_analysis(self) -> Tuple[bool, str]:
         """Check if weekend analysis should be skipped."""
         weekend_config = self.config.get('weekend_analysis', {})
@@ -66,100 +248,217 @@ class PortfolioAnalysisOrchestrator:
             return True, "size_reduction_percentage set to 0 in configuration"
         return False, ""
 
-    def run_comprehensive_analysis(self, positions_file: str) -> Dict[str, Any]:
-        """Run comprehensive analysis including portfolio, correlation, weekend, and HTML report."""
+    def run_comprehensive_analysis(self, positions_file: str, keep_raw_data: bool = False,
+                                   force: bool = False) -> Dict[str, Any]:
+        """
+        Run comprehensive analysis including portfolio, correlation, weekend, and HTML report.
+        
+        Args:
+            positions_file (str): Path to positions CSV
+            keep_raw_data (bool): Keep the 'raw_data' frames (positions, daily returns, SOL rates) in the
+                returned portfolio/correlation results - for debugging only
+            force (bool): Re-run even if a report for identical inputs is in the report cache
+        """
 
-        logger.info("=" * 60)
-        logger.info("STARTING COMPREHENSIVE ANALYSIS")
-        logger.info("=" * 60)
+        banner = "=" * 60
+        logger.info(f"{banner}\nSTARTING COMPREHENSIVE ANALYSIS\n{banner}")
         
         start_time = datetime.now()
         
+        # AIDEV-PERF-CLAUDE: unchanged CSV/config/code -> the previous report is reproducible; return it instead of
+        # re-running steps 0-4. Skipped for keep_raw_data, since stored results carry no raw frames.
+        report_key = None if keep_raw_data else self._inputs_key(positions_file)
+        if report_key and not force:
+            cached_result = self._result_cache.load_report(report_key)
+            if cached_result is not None:
+                html_report = cached_result['files_generated']['html_report']
+                logger.info(f"Reusing cached report for unchanged inputs: {html_report}")
+                return cached_result
+        
+        # AIDEV-PERF-CLAUDE: compile/load the Numba metric kernels only once a full run is certain (not on cache
+        # hits, quick or period analyses); they are ready before step 1 needs them.
+        warm_up_kernels()
+        
         try:
+            from reporting.strategy_instance_detector import run_instance_detection
+
             # AIDEV-NOTE-CLAUDE: Ensure strategy instances are up-to-date before reporting.
             logger.info("Step 0: Running strategy instance detection...")
             run_instance_detection()
 
-            positions_df = load_and_prepare_positions(positions_file, self.analytics.min_threshold)
+            positions_df = self._load_positions(positions_file)
             if positions_df.empty:
                 return {'status': 'ERROR', 'error': 'No positions data after loading'}
 
             logger.info("Step 1: Running portfolio analysis...")
-            portfolio_result = self.analytics.analyze_dataframe(positions_df)
+            # Charts, HTML and the correlation step read raw_data (frames + pre-fetched SOL rates)
+            portfolio_result = self.analytics.analyze_dataframe(positions_df, include_raw=True, now=start_time)
             if 'error' in portfolio_result: return {'status': 'ERROR', **portfolio_result}
             
             # --- Text and Chart Generation (Portfolio) ---
             logger.info("Step 1a: Generating portfolio reports and charts...")
-            report_files, timestamp = self._generate_portfolio_reports(portfolio_result)
-            chart_files = self.chart_generator.generate_all_charts(portfolio_result)
-
-            # AIDEV-CLAUDE-ADDITION: New step for Spot vs. Bid-Ask analysis
-            logger.info("Step 1b: Running Spot vs. Bid-Ask strategy simulations...")
-            strategy_simulator = AnalysisRunner(api_key=self.api_key, config=self.config)
-            strategy_simulation_results = strategy_simulator.analyze_all_positions(positions_df)
+            report_files, timestamp = self._generate_portfolio_reports(portfolio_result, now=start_time)
 
-            logger.info("Step 2: Running market correlation analysis...")
-            # AIDEV-NOTE-GEMINI: ARCHITECTURAL FIX - Pass the pre-fetched SOL rates from portfolio_result
-            # to the correlation analyzer to prevent a redundant, incorrect API call.
-            sol_rates_for_correlation = portfolio_result.get('raw_data', {}).get('sol_rates', {})
-            correlation_analyzer = MarketCorrelationAnalyzer(self.config_path, api_key=self.api_key)
-            correlation_result = correlation_analyzer.analyze_market_correlation(positions_df, sol_rates=sol_rates_for_correlation)
-            
-            logger.info("Step 3: Running weekend parameter simulation...")
-            skip_weekend, skip_reason = self._should_skip_weekend_analysis()
-            
-            if skip_weekend:
-                logger.warning(f"Weekend simulation SKIPPED: {skip_reason}")
-                weekend_result = {'analysis_skipped': True, 'reason': skip_reason}
-            else:
-                weekend_simulator = WeekendSimulator(self.config_path)
-                weekend_result = weekend_simulator.run_simulation(positions_df)
-                weekend_report_path = self._generate_weekend_report(weekend_result, timestamp)
-                if weekend_report_path:
-                    report_files['weekend_simulation'] = weekend_report_path
+            # Keyed after step 0, which may have just updated the CSV
+            chart_files, strategy_simulation_results, correlation_result, weekend_result, weekend_report_path = \
+                self._run_parallel(positions_df, portfolio_result, timestamp, self._inputs_key(positions_file))
+            if weekend_report_path:
+                report_files['weekend_simulation'] = weekend_report_path
 
             logger.info("Step 4: Generating comprehensive HTML report...")
-            html_generator = HTMLReportGenerator(config=self.config)
-            html_file = html_generator.generate_comprehensive_report(
+            html_file = self.html_generator.generate_comprehensive_report(
                 portfolio_analysis=portfolio_result,
                 # AIDEV-CLAUDE-ADDITION: Pass new results to HTML generator
                 strategy_simulations=strategy_simulation_results,
                 correlation_analysis=correlation_result,
                 weekend_analysis=weekend_result
             )
+            # AIDEV-PERF-CLAUDE: charts and HTML were the last raw_data consumers - drop the frames so
+            # long-running callers don't pin them and result dicts stay cheap to log/serialize.
+            if not keep_raw_data:
+                portfolio_result.pop('raw_data', None)
+                correlation_result.pop('raw_data', None)
 
+            report_files = self._report_writer.drop_failed(report_files)
             execution_time = (datetime.now() - start_time).total_seconds()
             comprehensive_result = {
                 'status': 'SUCCESS', 'execution_time_seconds': execution_time,
                 'portfolio_analysis': portfolio_result,
-                'strategy_simulations': strategy_simulation_results, # Add this
+                'strategy_simulations': strategy_simulation_results,
                 'correlation_analysis': correlation_result,
                 'weekend_analysis': weekend_result,
                 'files_generated': {'html_report': html_file, 'text_reports': report_files, 'charts': chart_files}
             }
             self._log_comprehensive_summary(comprehensive_result)
+            if report_key:
+                self._result_cache.store_report(report_key, comprehensive_result)
             return comprehensive_result
 
         except Exception as e:
             logger.error(f"Comprehensive analysis failed: {e}", exc_info=True)
+            self._report_writer.flush()
             return {'status': 'ERROR', 'error': str(e)}
 
-    def _generate_portfolio_reports(self, analysis_result: Dict[str, Any]) -> Tuple[Dict[str, str], str]:
+    def _run_parallel(self, positions_df: pd.DataFrame, portfolio_result: Dict[str, Any], timestamp: str,
+                      inputs_key: Optional[str] = None) -> Tuple[Dict[str, str], List[Dict], Dict[str, Any], Dict[str, Any], Optional[str]]:
+        """
+        Run the steps that depend only on positions_df / portfolio_result concurrently.
+        
+        Charts (1a), Spot vs. Bid-Ask simulations (1b), market correlation (2) and the weekend
+        simulation (3) share no data, so wall time becomes the slowest step instead of the sum.
+        
+        Args:
+            positions_df (pd.DataFrame): Prepared positions (treated as read-only by every step)
+            portfolio_result (Dict[str, Any]): Step 1 result (provides pre-fetched SOL rates)
+            timestamp (str): Report timestamp shared with the weekend report file
+            inputs_key (Optional[str]): _inputs_key of the run, enabling the correlation/weekend result caches
+            
+        Returns:
+            Tuple: (chart files, strategy simulation results, correlation result, weekend result, weekend report path)
+        """
+        # AIDEV-PERF-CLAUDE: charts stay the only matplotlib user; they fan out on _chart_pool as independent
+        # OO Figures (no pyplot current-figure state or GUI backend). Logging is thread-safe.
+        sol_rates_for_correlation = portfolio_result.get('raw_data', {}).get('sol_rates', {})
+        skip_weekend, skip_reason = self._should_skip_weekend_analysis()
+        
+        # One worker per step; the pool lives as long as the orchestrator. Chart rendering fans out on its own
+        # pool (one worker per chart, up to 8), so a chart task never waits on a step worker.
+        executor = self._pool('_step_pool', 4, "analysis-steps")
+        chart_pool = self._pool('_chart_pool', min(8, os.cpu_count() or 1), "charts")
+        futures = {
+            executor.submit(self.chart_generator.generate_all_charts, portfolio_result, chart_pool): 'charts',
+            executor.submit(self._run_strategy_simulations, positions_df): 'strategy_simulations',
+            executor.submit(
+                self._run_correlation_analysis, positions_df, sol_rates_for_correlation, inputs_key
+            ): 'correlation',
+        }
+        if skip_weekend:
+            logger.warning(f"Weekend simulation SKIPPED: {skip_reason}")
+        else:
+            futures[executor.submit(self._run_weekend_analysis, positions_df, timestamp, inputs_key)] = 'weekend'
+        
+        results: Dict[str, Any] = {}
+        for future in as_completed(futures):
+            step = futures[future]
+            try:
+                results[step] = future.result()
+                logger.info(f"Parallel step finished: {step}")
+            except Exception as e:
+                logger.error(f"Parallel step '{step}' failed: {e}", exc_info=True)
+        
+        weekend_result, weekend_report_path = results.get(
+            'weekend', ({'analysis_skipped': True, 'reason': skip_reason}, None) if skip_weekend else ({'error': 'Weekend simulation failed'}, None)
+        )
+        return (
+            results.get('charts', {}),
+            results.get('strategy_simulations', []),
+            results.get('correlation', {'error': 'Market correlation analysis failed'}),
+            weekend_result,
+            weekend_report_path
+        )
+
+    def _run_strategy_simulations(self, positions_df: pd.DataFrame) -> List[Dict]:
+        """Step 1b: Spot vs. Bid-Ask strategy simulations."""
+        # AIDEV-CLAUDE-ADDITION: New step for Spot vs. Bid-Ask analysis
+        logger.info("Step 1b: Running Spot vs. Bid-Ask strategy simulations...")
+        return self.strategy_runner.analyze_all_positions(positions_df)
+
+    def _run_correlation_analysis(self, positions_df: pd.DataFrame, sol_rates: Dict[str, Optional[float]],
+                                  inputs_key: Optional[str] = None) -> Dict[str, Any]:
+        """Step 2: market correlation analysis (disk-cached); failures are returned as an error dict."""
+        logger.info("Step 2: Running market correlation analysis...")
+        try:
+            # AIDEV-NOTE-GEMINI: ARCHITECTURAL FIX - Pass the pre-fetched SOL rates from portfolio_result
+            # to the correlation analyzer to prevent a redundant, incorrect API call.
+            key = None
+            if inputs_key is not None:
+                key = hashlib.blake2b(f"{inputs_key}:{sorted(sol_rates.items())}".encode(), digest_size=16).hexdigest()
+            result = self._result_cache.cached(
+                'correlation', key,
+                lambda: self.correlation_analyzer.analyze_market_correlation(
+                    positions_df, sol_rates=sol_rates, include_raw=True
+                )
+            )
+            if 'error' not in result and 'raw_data' not in result:
+                # Restored from cache: the HTML correlation/EMA charts still need the daily frames
+                result['raw_data'] = self.correlation_analyzer.build_raw_data(positions_df, sol_rates)
+            return result
+        except Exception as e:
+            logger.error(f"Market correlation analysis failed: {e}", exc_info=True)
+            return {'error': str(e)}
+
+    def _run_weekend_analysis(self, positions_df: pd.DataFrame, timestamp: str,
+                              inputs_key: Optional[str] = None) -> Tuple[Dict[str, Any], Optional[str]]:
+        """Step 3: weekend parameter simulation (disk-cached) plus its text report; failures are returned as an error dict."""
+        logger.info("Step 3: Running weekend parameter simulation...")
+        try:
+            # AIDEV-PERF-CLAUDE: warm reruns on unchanged positions and config skip the simulation
+            weekend_result = self._result_cache.cached(
+                'weekend', inputs_key, lambda: self.weekend_simulator.run_simulation(positions_df)
+            )
+        except Exception as e:
+            logger.error(f"Weekend simulation failed: {e}", exc_info=True)
+            return {'error': str(e)}, None
+        return weekend_result, self._generate_weekend_report(weekend_result, timestamp)
+
+    def _generate_portfolio_reports(self, analysis_result: Dict[str, Any],
+                                    now: Optional[datetime] = None) -> Tuple[Dict[str, str], str]:
         """Generate and save portfolio and cost text reports."""
-        timestamp = datetime.now().strftime(self.config.get('visualization', {}).get('timestamp_format', '%Y%m%d_%H%M%S'))
+        # One clock snapshot per run: callers pass the time already stamped into analysis_metadata
+        timestamp = (now or datetime.now()).strftime(self._timestamp_format)
         portfolio_summary, infrastructure_impact = generate_portfolio_and_cost_reports(analysis_result)
         
         saved_files = {}
         try:
             portfolio_file = os.path.join(self.output_dir, f"portfolio_summary_{timestamp}.txt")
-            with open(portfolio_file, 'w') as f: f.write(portfolio_summary)
             saved_files['portfolio_summary'] = portfolio_file
             
             infra_file = os.path.join(self.output_dir, f"infrastructure_impact_{timestamp}.txt")
-            with open(infra_file, 'w') as f: f.write(infrastructure_impact)
             saved_files['infrastructure_impact'] = infra_file
+            
+            self._report_writer.submit([(portfolio_file, portfolio_summary), (infra_file, infrastructure_impact)])
 
-            logger.info("Successfully saved portfolio and cost reports.")
+            logger.info("Queued portfolio and cost reports for saving.")
             return saved_files, timestamp
         except Exception as e:
             logger.error(f"Failed to save main reports: {e}")
@@ -171,8 +470,8 @@ class PortfolioAnalysisOrchestrator:
         if report_content:
             try:
                 filepath = os.path.join(self.output_dir, f"weekend_simulation_{timestamp}.txt")
-                with open(filepath, 'w') as f: f.write(report_content)
-                logger.info(f"Successfully saved weekend simulation report: {filepath}")
+                self._report_writer.submit([(filepath, report_content)])
+                logger.info(f"Queued weekend simulation report: {filepath}")
                 return filepath
             except Exception as e:
                 logger.error(f"Failed to save weekend report: {e}")
@@ -183,41 +482,99 @@ class PortfolioAnalysisOrchestrator:
         if not self.api_key:
             return {'status': 'ERROR', 'error': 'API key is missing, cannot run quick analysis.'}
         logger.info("Running quick portfolio analysis (no charts)...")
+        now = datetime.now()
         try:
-            positions_df = load_and_prepare_positions(positions_file, self.analytics.min_threshold)
-            analysis_result = self.analytics.analyze_dataframe(positions_df)
+            # Quick path feeds only the metrics, so the CSV parse skips unused columns
+            analysis_result = self._cached_analysis(positions_file, now, lambda: self.analytics.analyze_dataframe(
+                self._load_positions(positions_file, usecols=REQUIRED_COLUMNS), now=now
+            ))
             if 'error' in analysis_result:
                 return {'status': 'ERROR', **analysis_result}
             
-            saved_files, _ = self._generate_portfolio_reports(analysis_result)
-            return {'status': 'SUCCESS', 'files_generated': saved_files}
+            saved_files, _ = self._generate_portfolio_reports(analysis_result, now=now)
+            return {'status': 'SUCCESS', 'files_generated': self._report_writer.drop_failed(saved_files)}
 
         except Exception as e:
             logger.error(f"Quick analysis failed: {e}", exc_info=True)
+            self._report_writer.flush()
             return {'status': 'ERROR', 'error': str(e)}
             
-    def analyze_specific_period(self, start_date_str: str, end_date_str: str, positions_file: str):
-        """Placeholder for period-specific analysis."""
-        logger.info(f"Analyzing from {start_date_str} to {end_date_str}. This feature is not fully implemented yet.")
-        # Future implementation would filter positions_df by date and run analysis.
-        pass
+    def analyze_specific_period(self, start_date_str: str, end_date_str: str, positions_file: str) -> Dict[str, Any]:
+        """
+        Run the portfolio analysis (reports, no charts) on positions closed within a date range.
+        
+        close_timestamp alone defines the period: a position opened before start_date_str but closed inside it
+        is included. The result's 'start_date' (and analysis_period_days and the SOL rate range) comes from
+        analyze_dataframe, which uses open_timestamp.min() of the selected positions - so it can precede
+        start_date_str.
+        
+        Args:
+            start_date_str (str): First day of the period (YYYY-MM-DD)
+            end_date_str (str): Last day of the period, inclusive (YYYY-MM-DD)
+            positions_file (str): Path to positions CSV
+            
+        Returns:
+            Dict[str, Any]: Status, portfolio analysis and generated files
+        """
+        logger.info(f"Analyzing positions closed from {start_date_str} to {end_date_str}...")
+        start_time = datetime.now()
+        try:
+            start_dt = pd.Timestamp(start_date_str)
+            end_exclusive = pd.Timestamp(end_date_str) + pd.Timedelta(days=1)
+        except ValueError as e:
+            return {'status': 'ERROR', 'error': f"Invalid period dates: {e}"}
+        if end_exclusive <= start_dt:
+            return {'status': 'ERROR', 'error': 'End date must not be before start date'}
+        
+        try:
+            # AIDEV-PERF-CLAUDE: read-only access to the cached, close-time sorted frame - the period slice below is
+            # the only thing analysed, and analyze_dataframe never mutates its input (cost allocation returns a new
+            # frame). Binary search on the sorted close times gives the slice bounds - no full-frame masks.
+            positions_df = self._load_positions(positions_file, copy=False, sort_by_close=True)
+            close_times = positions_df['close_timestamp'].to_numpy(dtype='datetime64[ns]')
+            lo = close_times.searchsorted(start_dt.to_datetime64(), side='left')
+            hi = close_times.searchsorted(end_exclusive.to_datetime64(), side='left')
+            period_df = positions_df.iloc[lo:hi]
+            if period_df.empty:
+                return {'status': 'ERROR', 'error': f"No positions closed between {start_date_str} and {end_date_str}"}
+            logger.info(f"{len(period_df)} of {len(positions_df)} positions fall within the period")
+            
+            analysis_result = self.analytics.analyze_dataframe(period_df, now=start_time)
+            if 'error' in analysis_result:
+                return {'status': 'ERROR', **analysis_result}
+            
+            saved_files, _ = self._generate_portfolio_reports(analysis_result, now=start_time)
+            return {
+                'status': 'SUCCESS', 'portfolio_analysis': analysis_result, 'files_generated': self._report_writer.drop_failed(saved_files),
+                'execution_time_seconds': (datetime.now() - start_time).total_seconds()
+            }
+        except Exception as e:
+            logger.error(f"Period analysis failed: {e}", exc_info=True)
+            self._report_writer.flush()
+            return {'status': 'ERROR', 'error': str(e)}
 
     def _log_comprehensive_summary(self, result: Dict[str, Any]):
         """Log a summary of the comprehensive analysis."""
-        logger.info("COMPREHENSIVE ANALYSIS SUMMARY:")
-        sol_metrics = result.get('portfolio_analysis', {}).get('sol_denomination', {})
-        logger.info(f"  Portfolio PnL: {sol_metrics.get('total_pnl_sol', 0):+.3f} SOL, Sharpe: {sol_metrics.get('sharpe_ratio', 0):.2f}")
+        # AIDEV-PERF-CLAUDE: lines collected and emitted as one record - one handler dispatch/write, and the
+        # summary stays contiguous when other threads log concurrently.
+        # A successful portfolio step always carries SOL metrics - a missing key is a bug, not a zero
+        sol_metrics = result['portfolio_analysis']['sol_denomination']
+        lines = [
+            "COMPREHENSIVE ANALYSIS SUMMARY:",
+            f"  Portfolio PnL: {sol_metrics['total_pnl_sol']:+.3f} SOL, Sharpe: {sol_metrics['sharpe_ratio']:.2f}"
+        ]
         
-        corr_metrics = result.get('correlation_analysis', {}).get('correlation_metrics', {})
+        corr_metrics = result['correlation_analysis'].get('correlation_metrics')
         if corr_metrics:
-            logger.info(f"  SOL Correlation: {corr_metrics.get('pearson_correlation', 0):.3f}")
+            lines.append(f"  SOL Correlation: {corr_metrics['pearson_correlation']:.3f}")
             
-        weekend_result = result.get('weekend_analysis', {})
+        weekend_result = result['weekend_analysis']
         if weekend_result.get('analysis_skipped'):
-            logger.info(f"  Weekend Simulation: SKIPPED ({weekend_result.get('reason')})")
+            lines.append(f"  Weekend Simulation: SKIPPED ({weekend_result.get('reason')})")
         elif 'error' not in weekend_result:
             rec = weekend_result.get('recommendations', {})
-            logger.info(f"  Weekend Param Rec: {rec.get('primary_recommendation', 'N/A')}")
+            lines.append(f"  Weekend Param Rec: {rec.get('primary_recommendation', 'N/A')}")
             
-        logger.info(f"  HTML Report: {result.get('files_generated', {}).get('html_report', 'N/A')}")
-        logger.info(f"  Execution Time: {result.get('execution_time_seconds', 0):.1f} seconds")
\ No newline at end of file
+        lines.append(f"  HTML Report: {result['files_generated']['html_report'] or 'N/A'}")
+        lines.append(f"  Execution Time: {result['execution_time_seconds']:.1f} seconds")
+        logger.info("\n".join(lines))
\ No newline at end of file
@@ -1,51 +1,128 @@
 import logging
 import os
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional
-import yaml
+from pathlib import Path
+from typing import Dict, Any, Optional, Tuple
+import numpy as np
 import pandas as pd
 
 from .infrastructure_cost_analyzer import InfrastructureCostAnalyzer
 from .data_loader import load_and_prepare_positions
 from .metrics_calculator import (
-    calculate_daily_returns, calculate_sol_metrics, calculate_usdc_metrics, calculate_currency_comparison
+    PositionArrays, build_sol_rate_series, calculate_portfolio_metrics, calculate_currency_comparison
 )
 from .text_reporter import generate_portfolio_and_cost_reports
+from utils.common import load_yaml_config
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+_NS_PER_DAY = 86_400 * 10**9
+
+_RATES_CACHE_SIZE = 4
+
+
+def _write_report(path: Path, content: str) -> None:
+    """Write a materialized text report as one unbuffered binary write (no TextIOWrapper/BufferedWriter setup)."""
+    with open(path, 'wb', buffering=0) as f:
+        view = memoryview(content.encode('utf-8'))
+        while view:  # raw writes may be partial
+            view = view[f.write(view):]
+
+
 class PortfolioAnalytics:
     def __init__(self, config_path: str, api_key: Optional[str] = None):
         self.config = self._load_config(config_path)
-        self.cost_analyzer = InfrastructureCostAnalyzer(config_path, api_key=api_key)
+        self._config_path = config_path
+        self._api_key = api_key
+        self._cost_analyzer: Optional[InfrastructureCostAnalyzer] = None
         self.min_threshold = self.config.get('portfolio_analysis', {}).get('min_position_threshold', 0.01)
+        self._timestamp_format = self.config.get('visualization', {}).get('timestamp_format', '%Y%m%d_%H%M%S')
+        self._rates_cache: "OrderedDict[Tuple[str, str], Dict[str, Optional[float]]]" = OrderedDict()
         self.output_dir = "reporting/output"
         os.makedirs(os.path.join(self.output_dir, "charts"), exist_ok=True)
         logger.info("Portfolio Analytics initialized")
 
+    @property
+    def cost_analyzer(self) -> InfrastructureCostAnalyzer:
+        """InfrastructureCostAnalyzer, created on first use (config-only callers never build it)."""
+        if self._cost_analyzer is None:
+            self._cost_analyzer = InfrastructureCostAnalyzer(self._config_path, api_key=self._api_key, config=self.config)
+        return self._cost_analyzer
+
     def _load_config(self, config_path: str) -> Dict:
         try:
-            with open(config_path, 'r') as f:
-                return yaml.safe_load(f)
+            return load_yaml_config(config_path)
         except FileNotFoundError:
-            logger.warning(f"Config file {config_path} not found. Using empty config.")
+            logger.warning("Config file %s not found. Using empty config.", config_path)
             return {}
 
-    def analyze_dataframe(self, positions_df: pd.DataFrame) -> Dict[str, Any]:
+    def _get_sol_rates(self, start_day: str, end_day: str) -> Dict[str, Optional[float]]:
+        """
+        SOL/USDC daily rates for a date range, memoized per range for the life of this instance.
+        
+        AIDEV-PERF-CLAUDE: reruns over the same positions (report regeneration, threshold tweaks) skip the price
+        cache / API round trip. Empty results (fetch failed) are not memoized so the next run retries.
+        
+        Args:
+            start_day (str): First day (YYYY-MM-DD), including the EMA buffer
+            end_day (str): Last day (YYYY-MM-DD)
+            
+        Returns:
+            Dict[str, Optional[float]]: Rates keyed by 'YYYY-MM-DD' (shared; treated as read-only downstream)
+        """
+        key = (start_day, end_day)
+        sol_rates = self._rates_cache.get(key)
+        if sol_rates is not None:
+            self._rates_cache.move_to_end(key)
+            logger.info("Reusing SOL/USDC rates for %s to %s", start_day, end_day)
+            return sol_rates
+        
+        sol_rates = self.cost_analyzer.get_sol_usdc_rates(start_day, end_day)
+        if sol_rates:
+            self._rates_cache[key] = sol_rates
+            if len(self._rates_cache) > _RATES_CACHE_SIZE:
+                self._rates_cache.popitem(last=False)
+        return sol_rates
+
+    def analyze_dataframe(self, positions_df: pd.DataFrame, include_usdc: bool = True,
+                          include_raw: bool = False, now: Optional[datetime] = None) -> Dict[str, Any]:
+        """
+        Run the portfolio analysis on prepared positions.
+
+        Args:
+            positions_df (pd.DataFrame): Positions from load_and_prepare_positions
+            include_usdc (bool): When False, skip USDC metrics and the currency comparison
+                (returned as empty metrics / empty dict) for SOL-only callers
+            include_raw (bool): Add 'raw_data' (cost-allocated positions, daily returns, SOL rates) for
+                chart/HTML/correlation consumers; report-only callers leave it off so no frames are retained
+            now (Optional[datetime]): Run timestamp for 'generated_timestamp'; pass the snapshot also given to
+                report saving so metadata and file names agree (default: current time)
+
+        Returns:
+            Dict[str, Any]: Analysis result, or {'error': ...}
+        """
         if positions_df.empty:
             return {'error': 'No positions data available'}
 
-        min_date, max_date = positions_df['open_timestamp'].min(), positions_df['close_timestamp'].max()
-        period_days = (max_date - min_date).days
+        # AIDEV-PERF-CLAUDE: bounds reduced on int64 nanosecond views (C-level min/max, no Timestamp boxing per
+        # reduction); Timestamps are built once for the date-string boundary below.
+        min_ns = positions_df['open_timestamp'].to_numpy(dtype='datetime64[ns]').view(np.int64).min()
+        max_ns = positions_df['close_timestamp'].to_numpy(dtype='datetime64[ns]').view(np.int64).max()
+        period_days = int((max_ns - min_ns) // _NS_PER_DAY)
+        min_date, max_date = pd.Timestamp(min_ns), pd.Timestamp(max_ns)
 
         # AIDEV-NOTE-GEMINI: ARCHITECTURAL FIX - Fetch SOL rates ONCE, at the very beginning, with buffer.
         # This dictionary will be the single source of truth for all downstream calculations.
         buffer_days = self.config.get('market_analysis', {}).get('ema_period', 50)
         fetch_start_dt = min_date - timedelta(days=buffer_days)
         
-        logger.info(f"Fetching SOL/USDC rates for main analysis from {fetch_start_dt.date()} to {max_date.date()} (includes buffer).")
-        sol_rates = self.cost_analyzer.get_sol_usdc_rates(fetch_start_dt.strftime("%Y-%m-%d"), max_date.strftime("%Y-%m-%d"))
+        # ISO date prefix == strftime("%Y-%m-%d") for Timestamps, without the strftime path; formatted once, reused below
+        start_day, end_day, fetch_start_day = (ts.isoformat()[:10] for ts in (min_date, max_date, fetch_start_dt))
+        
+        logger.info("Fetching SOL/USDC rates for main analysis from %s to %s (includes buffer).", fetch_start_day, end_day)
+        sol_rates = self._get_sol_rates(fetch_start_day, end_day)
 
         if not sol_rates:
             logger.warning("No SOL/USDC rates found. USDC and cost metrics will be incomplete.")
@@ -55,39 +132,47 @@ class PortfolioAnalytics:
             positions_df = self.cost_analyzer.allocate_costs_to_positions(positions_df, sol_rates=sol_rates)
         except ValueError as e:
             return {'error': str(e)}
-
-        daily_df = calculate_daily_returns(positions_df)
+        if positions_df.empty:
+            # Skip the metric pipeline entirely rather than reducing empty arrays
+            return {'error': 'No positions after cost allocation'}
 
         risk_free_rates = self.config.get('portfolio_analysis', {}).get('risk_free_rates', {'sol_staking': 0.05, 'usdc_staking': 0.03})
-        sol_metrics = calculate_sol_metrics(positions_df, daily_df, risk_free_rates['sol_staking'])
-        usdc_metrics = calculate_usdc_metrics(positions_df, sol_rates, risk_free_rates['usdc_staking'])
-        currency_comparison = calculate_currency_comparison(sol_rates, sol_metrics, usdc_metrics, positions_df)
+        sol_rate_series = build_sol_rate_series(sol_rates)
+        # AIDEV-PERF-CLAUDE: metric columns extracted once (SoA) after cost allocation, shared by both denominations
+        position_arrays = PositionArrays.from_frame(positions_df)
+        daily_df, sol_metrics, usdc_metrics = calculate_portfolio_metrics(
+            position_arrays, sol_rate_series, risk_free_rates, include_usdc=include_usdc
+        )
+        currency_comparison = (calculate_currency_comparison(sol_rate_series, sol_metrics, usdc_metrics, positions_df)
+                               if include_usdc else {})
         cost_summary = self.cost_analyzer.generate_cost_summary(positions_df, period_days)
 
-        return {
+        result = {
             'analysis_metadata': {
-                'generated_timestamp': datetime.now().isoformat(), 'analysis_period_days': period_days,
-                'start_date': min_date.strftime("%Y-%m-%d"), 'end_date': max_date.strftime("%Y-%m-%d"),
+                'generated_timestamp': (now or datetime.now()).isoformat(), 'analysis_period_days': period_days,
+                'start_date': start_day, 'end_date': end_day,
                 'positions_analyzed': len(positions_df)
             },
             'sol_denomination': sol_metrics, 'usdc_denomination': usdc_metrics,
-            'currency_comparison': currency_comparison, 'infrastructure_cost_impact': cost_summary,
-            'raw_data': {'positions_df': positions_df, 'daily_returns_df': daily_df, 'sol_rates': sol_rates}
+            'currency_comparison': currency_comparison, 'infrastructure_cost_impact': cost_summary
         }
+        if include_raw:
+            result['raw_data'] = {'positions_df': positions_df, 'daily_returns_df': daily_df, 'sol_rates': sol_rates}
+        return result
 
-    def generate_and_save_reports(self, analysis_result: Dict[str, Any]) -> Dict[str, str]:
-        timestamp_format = self.config.get('visualization', {}).get('timestamp_format', '%Y%m%d_%H%M%S')
-        timestamp = datetime.now().strftime(timestamp_format)
+    def generate_and_save_reports(self, analysis_result: Dict[str, Any], now: Optional[datetime] = None) -> Dict[str, str]:
+        timestamp = (now or datetime.now()).strftime(self._timestamp_format)
         portfolio_summary, infrastructure_impact = generate_portfolio_and_cost_reports(analysis_result)
         saved_files = {}
+        out = Path(self.output_dir)
         try:
-            portfolio_file = os.path.join(self.output_dir, f"portfolio_summary_{timestamp}.txt")
-            with open(portfolio_file, 'w') as f: f.write(portfolio_summary)
-            saved_files['portfolio_summary'] = portfolio_file
+            portfolio_file = out / f"portfolio_summary_{timestamp}.txt"
+            _write_report(portfolio_file, portfolio_summary)
+            saved_files['portfolio_summary'] = str(portfolio_file)
             
-            infra_file = os.path.join(self.output_dir, f"infrastructure_impact_{timestamp}.txt")
-            with open(infra_file, 'w') as f: f.write(infrastructure_impact)
-            saved_files['infrastructure_impact'] = infra_file
+            infra_file = out / f"infrastructure_impact_{timestamp}.txt"
+            _write_report(infra_file, infrastructure_impact)
+            saved_files['infrastructure_impact'] = str(infra_file)
         except Exception as e:
-            logger.error(f"Failed to save reports: {e}")
+            logger.error("Failed to save reports: %s", e)
         return saved_files
\ No newline at end of file
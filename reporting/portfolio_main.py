@@ -108,29 +108,31 @@ def main():
     parser.add_argument('-m', '--mode', choices=['comprehensive', 'quick', 'period'], help='Analysis mode to run directly')
     parser.add_argument('--start-date', help='Start date for period analysis (YYYY-MM-DD)')
     parser.add_argument('--end-date', help='End date for period analysis (YYYY-MM-DD)')
+    parser.add_argument('--force', action='store_true',
+                        help='Re-run comprehensive analysis even if a report for identical inputs already exists')
     
     args = parser.parse_args()
     
     try:
-        orchestrator = PortfolioAnalysisOrchestrator(args.config)
-        
-        if args.mode:
-            result = None
-            if args.mode == 'comprehensive':
-                result = orchestrator.run_comprehensive_analysis(args.file)
-            elif args.mode == 'quick':
-                result = orchestrator.run_quick_analysis(args.file)
-            elif args.mode == 'period':
-                if not (args.start_date and args.end_date):
-                    print("Error: --start-date and --end-date are required for period mode.")
-                    return 1
-                result = orchestrator.analyze_specific_period(args.start_date, args.end_date, args.file)
-            
-            if result:
-                print_results(result)
-        else:
-            # No mode specified, launch interactive menu
-            interactive_menu(orchestrator, args.file)
+        # Context manager joins pending report writes and shuts down the orchestrator's worker pools
+        with PortfolioAnalysisOrchestrator(args.config) as orchestrator:
+            if args.mode:
+                result = None
+                if args.mode == 'comprehensive':
+                    result = orchestrator.run_comprehensive_analysis(args.file, force=args.force)
+                elif args.mode == 'quick':
+                    result = orchestrator.run_quick_analysis(args.file)
+                elif args.mode == 'period':
+                    if not (args.start_date and args.end_date):
+                        print("Error: --start-date and --end-date are required for period mode.")
+                        return 1
+                    result = orchestrator.analyze_specific_period(args.start_date, args.end_date, args.file)
+                
+                if result:
+                    print_results(result)
+            else:
+                # No mode specified, launch interactive menu
+                interactive_menu(orchestrator, args.file)
             
         return 0
 
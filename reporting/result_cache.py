@@ -0,0 +1,178 @@
+"""
+Result Cache for Portfolio Analytics
+
+On-disk cache of analysis results keyed on the content of everything a run is
+derived from (positions CSV, config, code version, rate source). Entries are
+pickles under <output_dir>/.cache/<namespace>/, bounded per namespace with
+least-recently-used eviction.
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+import subprocess
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from reporting.infrastructure_cost_analyzer import InfrastructureCostAnalyzer
+from reporting.report_writer import atomic_write
+
+logger = logging.getLogger(__name__)
+
+_RESULT_CACHE_SIZE = 8  # entries kept per namespace (least recently used evicted)
+
+
+@lru_cache(maxsize=32)
+def _content_digest(abs_path: str, mtime_ns: int, size: int) -> str:
+    """Hash of a file's bytes, computed once per (mtime, size) version (both only participate in the cache key)."""
+    with open(abs_path, 'rb') as f:
+        return hashlib.file_digest(f, lambda: hashlib.blake2b(digest_size=16)).hexdigest()
+
+
+def _file_digest(path: str) -> str:
+    """Content hash of a file - unlike mtime, stable across rewrites with identical content. Raises OSError."""
+    abs_path = os.path.abspath(path)
+    stat = os.stat(abs_path)
+    return _content_digest(abs_path, stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=1)
+def _code_version() -> str:
+    """Git HEAD of the project checkout (resolved once per process); 'unknown' outside a git work tree."""
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', 'HEAD'], cwd=Path(__file__).resolve().parents[1],
+            capture_output=True, text=True, timeout=5, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return 'unknown'
+
+
+def compute_inputs_key(positions_file: str, config_path: str, min_threshold: float, online: bool) -> Optional[str]:
+    """
+    Hash of everything an analysis is derived from: positions file content, threshold, config file content,
+    code version (git HEAD), online/offline mode and the local SOL/USDC price cache (rate source).
+
+    AIDEV-NOTE-CLAUDE: content hashes, not mtimes - step 0 (instance detection) rewrites the positions CSV on
+    every comprehensive run, so an mtime key would never match the next run.
+
+    Args:
+        positions_file (str): Path to positions CSV
+        config_path (str): Path to the YAML config
+        min_threshold (float): Minimum absolute PnL filter applied by the loader
+        online (bool): Whether an API key is available (cache-only runs may see fewer rates)
+
+    Returns:
+        Optional[str]: Hex key, or None if an input can't be read (caching disabled)
+    """
+    try:
+        positions_digest = _file_digest(positions_file)
+        config_digest = _file_digest(config_path)
+    except OSError:
+        return None
+    rates_source = InfrastructureCostAnalyzer.rates_source_fingerprint()
+    fingerprint = (f"{positions_digest}:{min_threshold}:{config_digest}:"
+                   f"{_code_version()}:{online}:{rates_source}")
+    return hashlib.blake2b(fingerprint.encode(), digest_size=16).hexdigest()
+
+
+class ResultCache:
+    """Pickled analysis results under <output_dir>/.cache/<namespace>/<key>.pkl."""
+
+    def __init__(self, output_dir: str, max_entries: int = _RESULT_CACHE_SIZE):
+        self.cache_dir = os.path.join(output_dir, '.cache')
+        self.max_entries = max_entries
+
+    def _path(self, namespace: str, key: str) -> str:
+        return os.path.join(self.cache_dir, namespace, f"{key}.pkl")
+
+    def get(self, namespace: str, key: Optional[str]) -> Optional[Any]:
+        """
+        Load a value from the cache.
+
+        Args:
+            namespace (str): Cache name (one directory per namespace)
+            key (Optional[str]): Entry key (None = caching disabled)
+
+        Returns:
+            Optional[Any]: Stored value, or None on a miss or an unreadable entry
+        """
+        if key is None:
+            return None
+        cache_path = self._path(namespace, key)
+        try:
+            with open(cache_path, 'rb') as f:
+                value = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable {namespace} cache {cache_path}: {e}")
+            return None
+        try:
+            os.utime(cache_path)  # most recently used entries survive eviction
+        except OSError:
+            pass  # best-effort LRU touch: entry evicted by a concurrent run or read-only output dir
+        return value
+
+    def put(self, namespace: str, key: Optional[str], value: Any) -> None:
+        """Store a value, keeping the max_entries most recently used entries of the namespace."""
+        if key is None:
+            return
+        cache_path = self._path(namespace, key)
+        try:
+            namespace_dir = os.path.dirname(cache_path)
+            os.makedirs(namespace_dir, exist_ok=True)
+            atomic_write(cache_path, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+            entries = sorted((entry for entry in os.scandir(namespace_dir) if entry.name.endswith('.pkl')),
+                             key=lambda entry: entry.stat().st_mtime_ns, reverse=True)
+            for stale in entries[self.max_entries:]:
+                os.remove(stale.path)
+        except Exception as e:
+            logger.warning(f"Could not persist {namespace} cache: {e}")
+
+    def cached(self, namespace: str, key: Optional[str], compute: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Return a step result from the cache, or compute and store it.
+
+        Args:
+            namespace (str): Cache namespace
+            key (Optional[str]): Entry key, normally from compute_inputs_key (None disables the cache)
+            compute (Callable[[], Dict[str, Any]]): Produces the result on a miss; error results aren't cached
+
+        Returns:
+            Dict[str, Any]: Step result; restored results have no 'raw_data'
+        """
+        result = self.get(namespace, key)
+        if result is not None:
+            logger.info(f"Reusing cached {namespace} result (inputs unchanged)")
+            return result
+        result = compute()
+        if 'error' not in result:
+            # Raw frames are never persisted - they dominate the pickle and consumers rebuild them when needed
+            self.put(namespace, key, {name: value for name, value in result.items() if name != 'raw_data'})
+        return result
+
+    @staticmethod
+    def _report_files(result: Dict[str, Any]) -> List[str]:
+        """Files referenced by a comprehensive result (failed charts excluded)."""
+        files = result.get('files_generated', {})
+        paths = [files.get('html_report')]
+        paths.extend(files.get('text_reports', {}).values())
+        paths.extend(files.get('charts', {}).values())
+        return [path for path in paths if path and not path.startswith('ERROR')]
+
+    def load_report(self, key: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Return the stored comprehensive result for key if every file it references still exists."""
+        result = self.get('report', key)
+        if result is None or not all(os.path.exists(path) for path in self._report_files(result)):
+            return None
+        return result
+
+    def store_report(self, key: Optional[str], result: Dict[str, Any]) -> None:
+        """Cache a comprehensive result - only complete runs, so a failed HTML step is retried next time."""
+        if not result['files_generated'].get('html_report'):
+            logger.info("HTML report missing - result not cached")
+            return
+        self.put('report', key, result)
@@ -0,0 +1,170 @@
+"""
+SOL Trend Indicator Kernels
+
+Computes the EMA and EMA-slope series used by MarketCorrelationAnalyzer for
+SOL trend detection, plus the per-strategy batch statistics behind
+MarketCorrelationAnalyzer.analyze_many. Uses Numba kernels when numba is
+installed and falls back to the equivalent NumPy/pandas code otherwise.
+"""
+
+import logging
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+# Column layout of the batch_trend_stats output matrix
+BATCH_STAT_COLUMNS = (
+    'common_days', 'pearson_correlation', 'uptrend_days', 'uptrend_mean_return',
+    'downtrend_days', 'downtrend_mean_return', 't_statistic', 't_degrees_of_freedom'
+)
+
+
+def _ema_slope_loop(close: np.ndarray, alpha: float, min_periods: int, slope_period: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Single pass over closing prices computing an adjusted EMA and its percentage slope.
+
+    Matches pandas `ewm(span=..., adjust=True, min_periods=...).mean()` followed by
+    `pct_change(periods=slope_period)` for gap-free input.
+
+    Args:
+        close (np.ndarray): Daily closing prices (float64, no NaN)
+        alpha (float): EMA smoothing factor, 2 / (span + 1)
+        min_periods (int): Observations required before the EMA is emitted
+        slope_period (int): Lag (in days) for the EMA percentage change
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (ema, ema_slope) arrays, NaN where undefined
+    """
+    n = close.shape[0]
+    ema = np.empty(n, dtype=np.float64)
+    slope = np.empty(n, dtype=np.float64)
+    decay = 1.0 - alpha
+    numerator = 0.0
+    denominator = 0.0
+    for i in range(n):
+        numerator = close[i] + decay * numerator
+        denominator = 1.0 + decay * denominator
+        ema[i] = numerator / denominator if i + 1 >= min_periods else np.nan
+        if i >= slope_period:
+            slope[i] = ema[i] / ema[i - slope_period] - 1.0
+        else:
+            slope[i] = np.nan
+    return ema, slope
+
+
+# AIDEV-PERF-CLAUDE: fuses ewm().mean() + pct_change() into one compiled loop; pandas path kept as fallback.
+_ema_slope_kernel = njit(cache=True)(_ema_slope_loop) if NUMBA_AVAILABLE else None
+
+
+def compute_ema_indicators(close: np.ndarray, span: int, min_periods: int, slope_period: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compute EMA and EMA slope for a daily closing-price array.
+
+    Args:
+        close (np.ndarray): Daily closing prices sorted by date
+        span (int): EMA span (e.g. 50)
+        min_periods (int): Observations required before the EMA is emitted
+        slope_period (int): Lag (in days) for the EMA percentage change
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (ema, ema_slope) arrays aligned with close
+    """
+    close = np.ascontiguousarray(close, dtype=np.float64)
+    if _ema_slope_kernel is not None:
+        return _ema_slope_kernel(close, 2.0 / (span + 1.0), min_periods, slope_period)
+
+    ema = pd.Series(close).ewm(span=span, min_periods=min_periods).mean()
+    slope = ema.pct_change(periods=slope_period)
+    return ema.to_numpy(), slope.to_numpy()
+
+
+def _batch_trend_loop(returns: np.ndarray, pnl: np.ndarray, sol_returns: np.ndarray,
+                      is_uptrend: np.ndarray) -> np.ndarray:
+    """
+    Per-strategy correlation and trend statistics over a shared SOL day grid.
+
+    Row k of `returns`/`pnl` holds one strategy's daily values on the SOL dates, NaN on days
+    without closed positions. Mirrors MarketCorrelationAnalyzer's single-portfolio steps:
+    Pearson r of returns vs SOL returns, mean daily PnL per trend and Welch's t-statistic.
+
+    Args:
+        returns (np.ndarray): [n_strategies, n_days] daily portfolio returns
+        pnl (np.ndarray): [n_strategies, n_days] daily portfolio PnL
+        sol_returns (np.ndarray): [n_days] SOL daily returns
+        is_uptrend (np.ndarray): [n_days] boolean SOL uptrend flag
+
+    Returns:
+        np.ndarray: [n_strategies, len(BATCH_STAT_COLUMNS)] statistics, NaN where undefined
+    """
+    n_rows = returns.shape[0]
+    out = np.full((n_rows, 8), np.nan)
+    for k in prange(n_rows):
+        traded = ~np.isnan(pnl[k])
+        x = returns[k][traded]
+        y = sol_returns[traded]
+        day_pnl = pnl[k][traded]
+        up = is_uptrend[traded]
+        n = x.shape[0]
+        out[k, 0] = n
+
+        if n >= 2:
+            xc = x - x.mean()
+            yc = y - y.mean()
+            denominator = np.sqrt((xc * xc).sum() * (yc * yc).sum())
+            if denominator > 0:
+                out[k, 1] = min(max((xc * yc).sum() / denominator, -1.0), 1.0)
+
+        up_pnl = day_pnl[up]
+        down_pnl = day_pnl[~up]
+        n_up = up_pnl.shape[0]
+        n_down = down_pnl.shape[0]
+        out[k, 2] = n_up
+        out[k, 4] = n_down
+        out[k, 3] = up_pnl.mean() if n_up > 0 else 0.0
+        out[k, 5] = down_pnl.mean() if n_down > 0 else 0.0
+
+        if n_up > 1 and n_down > 1:
+            se_up = ((up_pnl - out[k, 3]) ** 2).sum() / (n_up - 1) / n_up
+            se_down = ((down_pnl - out[k, 5]) ** 2).sum() / (n_down - 1) / n_down
+            se_total = se_up + se_down
+            if se_total > 0:
+                out[k, 6] = (out[k, 3] - out[k, 5]) / np.sqrt(se_total)
+                out[k, 7] = se_total ** 2 / (se_up ** 2 / (n_up - 1) + se_down ** 2 / (n_down - 1))
+    return out
+
+
+# AIDEV-PERF-CLAUDE: rows are independent, so prange spreads strategies across cores; plain loop as fallback.
+_batch_trend_kernel = njit(parallel=True, cache=True)(_batch_trend_loop) if NUMBA_AVAILABLE else None
+
+
+def batch_trend_stats(returns: np.ndarray, pnl: np.ndarray, sol_returns: np.ndarray,
+                      is_uptrend: np.ndarray) -> np.ndarray:
+    """
+    Compute correlation and trend statistics for many strategies at once.
+
+    Args:
+        returns (np.ndarray): [n_strategies, n_days] daily returns on the SOL date grid (NaN = no trades)
+        pnl (np.ndarray): [n_strategies, n_days] daily PnL on the same grid
+        sol_returns (np.ndarray): [n_days] SOL daily returns
+        is_uptrend (np.ndarray): [n_days] boolean SOL uptrend flag
+
+    Returns:
+        np.ndarray: [n_strategies, len(BATCH_STAT_COLUMNS)] statistics matrix
+    """
+    returns = np.ascontiguousarray(returns, dtype=np.float64)
+    pnl = np.ascontiguousarray(pnl, dtype=np.float64)
+    sol_returns = np.ascontiguousarray(sol_returns, dtype=np.float64)
+    is_uptrend = np.ascontiguousarray(is_uptrend, dtype=np.bool_)
+    if _batch_trend_kernel is not None:
+        return _batch_trend_kernel(returns, pnl, sol_returns, is_uptrend)
+    return _batch_trend_loop(returns, pnl, sol_returns, is_uptrend)
@@ -147,7 +147,7 @@ class StrategyInstanceDetector:
         df['strategy_instance_id'] = df['strategy_instance_id'].astype('object')
 
         # STEP 1: Chronological sort
-        from reporting.data_loader import _parse_custom_timestamp
+        from extraction.parsing_utils import _parse_custom_timestamp
         df['open_timestamp_dt'] = df['open_timestamp'].apply(_parse_custom_timestamp)
         df = df.sort_values(by='open_timestamp_dt').reset_index(drop=True)
 
@@ -274,8 +274,19 @@ def run_instance_detection(input_csv: str = "positions_to_analyze.csv", output_c
         return False
     
     try:
-        updated_df.to_csv(input_csv, index=False)
-        logger.info(f"Updated {input_csv} with strategy instance IDs")
+        # Rewrite only on change: an untouched file keeps its mtime for downstream load caches
+        csv_content = updated_df.to_csv(index=False)
+        try:
+            with open(input_csv, 'r', newline='') as f:
+                unchanged = f.read() == csv_content
+        except OSError:
+            unchanged = False
+        if unchanged:
+            logger.info(f"{input_csv} already has current strategy instance IDs")
+        else:
+            with open(input_csv, 'w', newline='') as f:
+                f.write(csv_content)
+            logger.info(f"Updated {input_csv} with strategy instance IDs")
     except Exception as e:
         logger.error(f"Error updating positions CSV: {e}")
         return False
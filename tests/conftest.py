@@ -0,0 +1,7 @@
+import sys
+from pathlib import Path
+
+# AIDEV-NOTE-CLAUDE: tests import project packages (reporting, extraction) from the repository root
+_PROJECT_ROOT = str(Path(__file__).resolve().parent.parent)
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
@@ -0,0 +1,86 @@
+"""Tests for the positions CSV reader's engine selection."""
+
+import importlib.metadata
+import importlib.util
+
+import pandas as pd
+import pytest
+
+from reporting import data_loader
+
+
+def _write_positions(path):
+    pd.DataFrame({
+        'pnl_sol': [0.5, -0.2],
+        'strategy_raw': ['Spot 1.5', 'Bid-Ask 1.5'],
+        'investment_sol': [1.0, 1.0],
+        'open_timestamp': ['2025-05-01 10:00:00', '05/02-24:10:00'],
+        'close_timestamp': ['2025-05-01 12:00:00', '2025-05-03 09:00:00'],
+    }).to_csv(path, index=False)
+
+
+def test_outdated_polars_falls_back_to_pandas(tmp_path, monkeypatch, caplog):
+    csv_path = tmp_path / "positions.csv"
+    _write_positions(csv_path)
+    real_find_spec = importlib.util.find_spec
+    monkeypatch.setattr(importlib.util, 'find_spec',
+                        lambda name, *args: object() if name in ('polars', 'pyarrow') else real_find_spec(name, *args))
+    monkeypatch.setattr(importlib.metadata, 'version', lambda name: '0.20.31')
+
+    result, read_count = data_loader._read_positions_csv(str(csv_path), None, 'polars')
+
+    pd.testing.assert_frame_equal(result, pd.read_csv(csv_path))
+    assert read_count == 2
+    assert "older than 1.0" in caplog.text
+
+
+def test_version_tuple_ignores_pre_release_suffix():
+    assert data_loader._version_tuple('1.2.0rc1') == (1, 2, 0)
+    assert data_loader._version_tuple('0.20.31') < (1, 0)
+
+
+def _write_mixed_positions(path):
+    """Sub-threshold rows, NaN pnl, and ISO (naive and offset) plus custom MM/DD-HH:MM:SS timestamps."""
+    pd.DataFrame({
+        'pnl_sol': [0.5, 0.004, -0.2, None, -0.003, 1.25, -0.75],
+        'strategy_raw': ['Spot 1.5 WIDE', 'Bid-Ask 1.5', 'Spot', 'Bid-Ask NARROW', 'Spot', 'Bid-Ask MEDIUM', 'Spot'],
+        'investment_sol': [1.0, 1.0, 2.0, 1.0, 1.0, 1.5, 2.0],
+        # All naive ISO: pyarrow infers a timestamp column here
+        'open_timestamp': ['2025-05-01 10:00:00', '2025-05-01 11:00:00', '2025-05-02 08:00:00',
+                           '2025-05-02 09:00:00', '2025-05-03 07:00:00', '2025-05-03 20:00:00', '2025-05-04 06:00:00'],
+        'close_timestamp': ['2025-05-01 12:00:00', '05/01-13:00:00', '05/02-24:10:00', '2025-05-02 10:00:00',
+                            '2025-05-03 08:00:00+00:00', '2025-05-04T01:30:00Z', '05/04-09:15:30'],
+    }).to_csv(path, index=False)
+
+
+def _load(csv_path, engine, caplog):
+    caplog.clear()
+    with caplog.at_level('INFO', logger=data_loader.logger.name):
+        positions_df = data_loader.load_and_prepare_positions(str(csv_path), 0.01, engine=engine)
+    return positions_df, [record.getMessage() for record in caplog.records if 'positions' in record.getMessage()]
+
+
+def test_pandas_engine_logs_read_and_filtered_counts(tmp_path, caplog):
+    csv_path = tmp_path / "positions.csv"
+    _write_mixed_positions(csv_path)
+
+    positions_df, messages = _load(csv_path, 'pandas', caplog)
+
+    assert len(positions_df) == 4
+    assert f"Loaded 7 positions from {csv_path}" in messages
+    assert "Filtered 3 positions below 0.01 SOL threshold" in messages
+
+
+@pytest.mark.parametrize('engine, packages', [('pyarrow', ('pyarrow',)), ('polars', ('polars', 'pyarrow'))])
+def test_optional_engine_matches_pandas(tmp_path, caplog, engine, packages):
+    for package in packages:
+        pytest.importorskip(package)
+    csv_path = tmp_path / "positions.csv"
+    _write_mixed_positions(csv_path)
+
+    expected, expected_messages = _load(csv_path, 'pandas', caplog)
+    result, messages = _load(csv_path, engine, caplog)
+
+    # The engines filter before building the pandas frame, so only the index labels differ
+    pd.testing.assert_frame_equal(result.reset_index(drop=True), expected.reset_index(drop=True))
+    assert messages == expected_messages
@@ -0,0 +1,76 @@
+"""Parity of the fused metrics and drawdown kernels with metrics_calculator's NumPy fallback."""
+
+import numpy as np
+import pytest
+
+from reporting import metrics_calculator, metrics_kernel
+
+# Pure-Python loops always; compiled kernels too when Numba is installed
+METRICS_IMPLEMENTATIONS = [metrics_kernel._metrics_loop] + [
+    kernel for kernel in (metrics_kernel.metrics_kernel,) if kernel is not None
+]
+DRAWDOWN_IMPLEMENTATIONS = [metrics_kernel._drawdown_loop] + [
+    kernel for kernel in (metrics_kernel.drawdown_kernel,) if kernel is not None
+]
+
+
+def _positions(seed: int, n: int, n_days: int):
+    rng = np.random.default_rng(seed)
+    pnl = rng.normal(0.0, 1.0, n)
+    day_codes = np.sort(rng.integers(0, n_days, n)).astype(np.int64)
+    has_positions = np.bincount(day_codes) > 0
+    return pnl, day_codes, has_positions
+
+
+def _numpy_pass(monkeypatch, pnl, day_codes, has_positions, capital_base, ddof):
+    monkeypatch.setattr(metrics_calculator, 'metrics_kernel', None)
+    monkeypatch.setattr(metrics_calculator, 'drawdown_kernel', None)
+    return metrics_calculator._denomination_pass(
+        'total_pnl_sol', pnl, day_codes, has_positions, capital_base, 0.0, 0.05, ddof
+    )
+
+
+@pytest.mark.parametrize('kernel', METRICS_IMPLEMENTATIONS)
+@pytest.mark.parametrize('seed, n, n_days, capital_base, ddof', [
+    (0, 200, 40, 150.0, 1),
+    (1, 50, 90, 75.0, 0),   # sparse days: gaps in the day offsets
+    (2, 30, 5, 0.0, 1),     # zero capital base yields zero returns and Sharpe 0
+    (3, 5, 1, 10.0, 1),     # single day: no Sharpe, no drawdown
+])
+def test_metrics_kernel_matches_numpy_fallback(monkeypatch, kernel, seed, n, n_days, capital_base, ddof):
+    pnl, day_codes, has_positions = _positions(seed, n, n_days)
+    daily, cumulative, _, expected = _numpy_pass(monkeypatch, pnl, day_codes, has_positions, capital_base, ddof)
+
+    k_daily, k_cumulative, total, win_rate, profit_factor, sharpe, max_drawdown = kernel(
+        pnl, day_codes, has_positions.size, capital_base, 0.05, ddof
+    )
+
+    np.testing.assert_allclose(k_daily, daily, rtol=1e-12)
+    np.testing.assert_allclose(k_cumulative, cumulative, rtol=1e-12)
+    assert total == pytest.approx(expected['total_pnl_sol'], rel=1e-12)
+    assert win_rate == pytest.approx(expected['win_rate'])
+    assert profit_factor == pytest.approx(expected['profit_factor'], rel=1e-12)
+    assert sharpe == pytest.approx(expected['sharpe_ratio'], rel=1e-9, abs=1e-12)
+    assert max_drawdown == pytest.approx(expected['max_drawdown_percent'], rel=1e-12)
+
+
+@pytest.mark.parametrize('kernel', METRICS_IMPLEMENTATIONS)
+def test_metrics_kernel_profit_factor_without_losses(kernel):
+    pnl = np.array([0.5, 1.0, 0.0], dtype=np.float64)
+    day_codes = np.array([0, 1, 1], dtype=np.int64)
+    *_, total, win_rate, profit_factor, _, _ = kernel(pnl, day_codes, 2, 10.0, 0.0, 1)
+    assert total == 1.5 and win_rate == pytest.approx(2 / 3) and profit_factor == np.inf
+
+
+@pytest.mark.parametrize('kernel', DRAWDOWN_IMPLEMENTATIONS)
+@pytest.mark.parametrize('cumulative', [
+    [1.0, 3.0, 2.0, 4.0, 1.0],
+    [0.0, -1.0, -2.0, 0.5],          # zero peak divides by 1
+    [-2.0, -3.0, -1.0, -4.0],        # negative peak uses its absolute value
+    [1.0, 2.0, np.nan, 0.0],         # values from the first NaN onwards are ignored
+    [np.nan, 1.0, 0.5],
+])
+def test_drawdown_kernel_matches_numpy_fallback(monkeypatch, kernel, cumulative):
+    cumulative = np.array(cumulative, dtype=np.float64)
+    monkeypatch.setattr(metrics_calculator, 'drawdown_kernel', None)
+    assert kernel(cumulative) == pytest.approx(metrics_calculator._max_drawdown(cumulative), rel=1e-12)
@@ -0,0 +1,62 @@
+"""Tests for the vectorized timestamp parser against the per-row parsing it replaced."""
+
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from extraction.parsing_utils import _parse_custom_timestamp
+from extraction.timestamp_parsing import parse_timestamp_series
+
+
+def _parse_per_row(value) -> pd.Timestamp:
+    """Previous loader behaviour: pd.to_datetime first, _parse_custom_timestamp as fallback, naive UTC."""
+    text = str(value)
+    if text.lower() in ('nan', 'nat', 'none', ''):
+        return pd.NaT
+    parsed = pd.to_datetime(text, errors='coerce')
+    if pd.isna(parsed):
+        parsed = _parse_custom_timestamp(text)
+        return pd.NaT if parsed is None else pd.Timestamp(parsed)
+    return parsed.tz_convert(None) if parsed.tzinfo is not None else parsed
+
+
+def test_matches_per_row_parser():
+    values = pd.Series([
+        '2025-05-03 10:00:00', '2025-05-03T10:00:00', '2025-05-03', '05/12-20:57:08', '5/2-1:02:03',
+        '05/12-24:10:00', '05/12-30:00:00', 'May 3 2025 10:00', '13/40-10:00:00', '05/12-10:75:00',
+        'garbage', '', 'nan', None, np.nan,
+    ])
+    expected = pd.Series([_parse_per_row(value) for value in values]).astype('datetime64[ns]')
+    pd.testing.assert_series_equal(parse_timestamp_series(values), expected)
+
+
+def test_hour_24_is_midnight_of_the_same_day():
+    parsed = parse_timestamp_series(pd.Series(['05/12-24:10:00']))
+    assert parsed.iloc[0] == pd.Timestamp(datetime.now().year, 5, 12, 0, 10)
+
+
+@pytest.mark.parametrize('values, expected', [
+    (['2024-05-01T10:00:00+00:00'], ['2024-05-01 10:00:00']),
+    (['2024-05-01T12:00:00+02:00', '2024-05-01 09:30:00'], ['2024-05-01 10:00:00', '2024-05-01 09:30:00']),
+])
+def test_offset_aware_strings_become_naive_utc(values, expected):
+    parsed = parse_timestamp_series(pd.Series(values))
+    assert parsed.dtype == 'datetime64[ns]'
+    assert list(parsed) == [pd.Timestamp(ts) for ts in expected]
+
+
+def test_datetime_input_passes_through():
+    aware = pd.Series(pd.to_datetime(['2024-05-01 12:00'])).dt.tz_localize('Europe/Warsaw')
+    parsed = parse_timestamp_series(aware)
+    assert parsed.dtype == 'datetime64[ns]'
+    assert parsed.iloc[0] == pd.Timestamp('2024-05-01 10:00')
+
+
+def test_keeps_caller_index_including_duplicate_labels():
+    values = pd.Series(['05/12-20:57:08', '2024-05-01T10:00:00+00:00', '2024-05-01 09:30:00'],
+                       index=[7, 7, 3], name='close_timestamp')
+    parsed = parse_timestamp_series(values)
+    assert list(parsed.index) == [7, 7, 3] and parsed.name == 'close_timestamp'
+    assert list(parsed.iloc[1:]) == [pd.Timestamp('2024-05-01 10:00'), pd.Timestamp('2024-05-01 09:30')]
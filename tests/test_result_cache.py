@@ -0,0 +1,50 @@
+"""Tests for the on-disk result cache."""
+
+import os
+
+from reporting.result_cache import ResultCache
+
+
+def test_put_get_round_trip_and_lru_eviction(tmp_path):
+    cache = ResultCache(str(tmp_path), max_entries=2)
+    for key, ns_time in (('a', 1), ('b', 2), ('c', 3)):
+        cache.put('weekend', key, {'key': key})
+        os.utime(cache._path('weekend', key), ns=(ns_time * 10**9, ns_time * 10**9))
+    cache.put('weekend', 'd', {'key': 'd'})  # evicts the two oldest entries
+
+    assert cache.get('weekend', 'a') is None and cache.get('weekend', 'b') is None
+    assert cache.get('weekend', 'd') == {'key': 'd'}
+    assert cache.get('weekend', None) is None
+
+
+def test_cached_strips_raw_data_and_skips_errors(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    assert cache.cached('correlation', 'k', lambda: {'value': 1, 'raw_data': object()})['value'] == 1
+    assert cache.get('correlation', 'k') == {'value': 1}
+
+    cache.cached('correlation', 'e', lambda: {'error': 'boom'})
+    assert cache.get('correlation', 'e') is None
+
+
+def test_get_survives_failed_lru_touch(tmp_path, monkeypatch):
+    cache = ResultCache(str(tmp_path))
+    cache.put('report', 'k', {'files_generated': {}})
+
+    def evicted(path, *args, **kwargs):
+        raise FileNotFoundError(path)
+    monkeypatch.setattr(os, 'utime', evicted)
+
+    assert cache.get('report', 'k') == {'files_generated': {}}
+
+
+def test_store_report_requires_html_and_load_checks_files(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    cache.store_report('none', {'files_generated': {'html_report': None}})
+    assert cache.get('report', 'none') is None
+
+    html = tmp_path / "report.html"
+    html.write_text("<html></html>")
+    cache.store_report('ok', {'files_generated': {'html_report': str(html), 'text_reports': {}, 'charts': {}}})
+    assert cache.load_report('ok') is not None
+    html.unlink()
+    assert cache.load_report('ok') is None
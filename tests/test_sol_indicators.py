@@ -0,0 +1,123 @@
+"""EMA/slope and batch trend kernels: parity with pandas, SciPy and the single-portfolio analysis."""
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from reporting import sol_indicators
+
+EMA_IMPLEMENTATIONS = [sol_indicators._ema_slope_loop] + [
+    kernel for kernel in (sol_indicators._ema_slope_kernel,) if kernel is not None
+]
+
+
+@pytest.mark.parametrize('kernel', EMA_IMPLEMENTATIONS)
+@pytest.mark.parametrize('span, min_periods, slope_period, n', [
+    (50, 50, 5, 200),
+    (20, 1, 3, 60),
+    (50, 50, 5, 30),   # shorter than min_periods: EMA and slope all NaN
+])
+def test_ema_slope_matches_pandas_ewm(kernel, span, min_periods, slope_period, n):
+    close = 150.0 * np.exp(np.cumsum(np.random.default_rng(span + n).normal(0.0, 0.03, n)))
+    expected_ema = pd.Series(close).ewm(span=span, adjust=True, min_periods=min_periods).mean()
+    expected_slope = expected_ema.pct_change(periods=slope_period, fill_method=None)
+
+    ema, slope = kernel(close, 2.0 / (span + 1.0), min_periods, slope_period)
+
+    np.testing.assert_allclose(ema, expected_ema.to_numpy(), rtol=1e-12, equal_nan=True)
+    np.testing.assert_allclose(slope, expected_slope.to_numpy(), rtol=1e-9, atol=1e-15, equal_nan=True)
+
+
+def test_compute_ema_indicators_accepts_float32_input():
+    close = np.linspace(100.0, 120.0, 80, dtype=np.float32)
+    ema, slope = sol_indicators.compute_ema_indicators(close, span=20, min_periods=20, slope_period=5)
+    expected = pd.Series(close.astype(np.float64)).ewm(span=20, min_periods=20).mean()
+    np.testing.assert_allclose(ema, expected.to_numpy(), rtol=1e-12, equal_nan=True)
+    assert ema.dtype == np.float64 and slope.shape == close.shape
+
+
+BATCH_IMPLEMENTATIONS = [sol_indicators._batch_trend_loop] + [
+    kernel for kernel in (sol_indicators._batch_trend_kernel,) if kernel is not None
+]
+
+
+def _batch_inputs(seed: int, n_strategies: int = 4, n_days: int = 60):
+    rng = np.random.default_rng(seed)
+    pnl = rng.normal(0.0, 1.0, (n_strategies, n_days))
+    pnl[rng.random((n_strategies, n_days)) < 0.4] = np.nan  # days without closed positions
+    pnl[-1, 2:] = np.nan                                       # too few days for correlation or t-test
+    returns = pnl / 50.0
+    return returns, pnl, rng.normal(0.0, 0.03, n_days), rng.random(n_days) < 0.5
+
+
+@pytest.mark.parametrize('kernel', BATCH_IMPLEMENTATIONS)
+def test_batch_trend_stats_matches_scipy_per_row(kernel):
+    stats = pytest.importorskip('scipy.stats')
+    returns, pnl, sol_returns, is_uptrend = _batch_inputs(seed=7)
+
+    batch = kernel(returns, pnl, sol_returns, is_uptrend)
+
+    for row in range(returns.shape[0]):
+        traded = ~np.isnan(pnl[row])
+        up_pnl, down_pnl = pnl[row][traded & is_uptrend], pnl[row][traded & ~is_uptrend]
+        assert batch[row, 0] == traded.sum()
+        assert (batch[row, 2], batch[row, 4]) == (up_pnl.size, down_pnl.size)
+        if traded.sum() >= 2:
+            r = stats.pearsonr(returns[row][traded], sol_returns[traded])[0]
+            assert batch[row, 1] == pytest.approx(r, rel=1e-9)
+        else:
+            assert np.isnan(batch[row, 1])
+        if up_pnl.size > 1 and down_pnl.size > 1:
+            welch = stats.ttest_ind(up_pnl, down_pnl, equal_var=False)
+            assert batch[row, 3] == pytest.approx(up_pnl.mean()) and batch[row, 5] == pytest.approx(down_pnl.mean())
+            assert batch[row, 6] == pytest.approx(welch.statistic, rel=1e-9)
+        else:
+            assert np.isnan(batch[row, 6])
+
+
+@pytest.mark.skipif(sol_indicators._batch_trend_kernel is None, reason="numba not installed")
+def test_batch_trend_kernel_matches_python_loop():
+    inputs = _batch_inputs(seed=11, n_strategies=16, n_days=120)
+    np.testing.assert_allclose(sol_indicators._batch_trend_kernel(*inputs),
+                               sol_indicators._batch_trend_loop(*inputs), rtol=1e-12, equal_nan=True)
+
+
+def test_analyze_many_matches_single_portfolio_analysis():
+    pytest.importorskip('scipy')
+    from reporting.market_correlation_analyzer import MarketCorrelationAnalyzer
+
+    rng = np.random.default_rng(3)
+    days = pd.date_range('2025-01-01', periods=160, freq='D')
+    sol_rates = {day.strftime('%Y-%m-%d'): float(price)
+                 for day, price in zip(days, 150.0 * np.exp(np.cumsum(rng.normal(0.0, 0.03, days.size))))}
+
+    def positions(n: int) -> pd.DataFrame:
+        close = days[60:][rng.integers(0, 100, n)] + pd.Timedelta(hours=12)
+        return pd.DataFrame({'open_timestamp': close - pd.Timedelta(hours=6), 'close_timestamp': close,
+                             'pnl_sol': rng.normal(0.01, 0.2, n), 'investment_sol': rng.uniform(0.5, 2.0, n)})
+
+    by_strategy = {'spot_wide': positions(120), 'bidask_narrow': positions(40), 'sparse': positions(3)}
+    config_path = str(Path(__file__).resolve().parents[1] / 'reporting' / 'config' / 'portfolio_config.yaml')
+    analyzer = MarketCorrelationAnalyzer(config_path)
+
+    batch = analyzer.analyze_many(by_strategy, sol_rates)
+
+    assert list(batch.index) == list(by_strategy)
+    for strategy, positions_df in by_strategy.items():
+        single = analyzer.analyze_market_correlation(positions_df, sol_rates)
+        row = batch.loc[strategy]
+        correlation = single['correlation_metrics']
+        assert row['common_days'] == correlation['common_days']
+        assert row['pearson_correlation'] == pytest.approx(correlation['pearson_correlation'], rel=1e-9)
+        assert row['pearson_p_value'] == pytest.approx(correlation['pearson_p_value'], rel=1e-9)
+        trend = single['trend_analysis']
+        assert row['uptrend_days'] == trend['uptrend']['days']
+        assert row['uptrend_mean_return'] == pytest.approx(trend['uptrend']['mean_return'], rel=1e-12)
+        assert row['downtrend_mean_return'] == pytest.approx(trend['downtrend']['mean_return'], rel=1e-12)
+        if 'performance_difference' in trend:
+            assert row['t_statistic'] == pytest.approx(trend['performance_difference']['t_statistic'], rel=1e-9)
+            assert row['t_p_value'] == pytest.approx(trend['performance_difference']['t_p_value'], rel=1e-9)
+        else:
+            assert np.isnan(row['t_statistic'])
@@ -18,8 +18,9 @@ import yaml
 # Add project root to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from extraction.parsing_utils import extract_peak_pnl_from_logs, extract_total_fees_from_logs, clean_ansi
-from reporting.data_loader import _parse_custom_timestamp
+from extraction.parsing_utils import (
+    extract_peak_pnl_from_logs, extract_total_fees_from_logs, clean_ansi, _parse_custom_timestamp
+)
 
 logging.basicConfig(
     level=logging.INFO,
@@ -1,13 +1,49 @@
+import os
 import yaml
 import logging
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
+# AIDEV-PERF-CLAUDE: libyaml C loader when PyYAML was built with it (same safe schema, several times faster)
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+
+@lru_cache(maxsize=8)
+def _parse_yaml(abs_path: str, mtime_ns: int) -> dict:
+    """Parse one YAML file version (mtime_ns only participates in the cache key)."""
+    with open(abs_path, 'r') as f:
+        return yaml.load(f, Loader=_YamlLoader) or {}
+
+
+def load_yaml_config(path: str) -> dict:
+    """
+    Load a YAML config file, parsing it once per file version.
+
+    AIDEV-NOTE-CLAUDE: cached on (abspath, mtime_ns), so an edited file is re-read. The returned dict is
+    shared between callers - treat it as read-only.
+
+    Args:
+        path (str): Path to the YAML file
+
+    Returns:
+        dict: Parsed configuration ({} for an empty file)
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        yaml.YAMLError: If the file is not valid YAML
+    """
+    abs_path = os.path.abspath(path)
+    return _parse_yaml(abs_path, os.stat(abs_path).st_mtime_ns)
+
+
 def load_main_config() -> dict:
     """Loads the main YAML configuration."""
     try:
-        with open("reporting/config/portfolio_config.yaml", 'r') as f:
-            return yaml.safe_load(f)
+        return load_yaml_config("reporting/config/portfolio_config.yaml")
     except (FileNotFoundError, yaml.YAMLError) as e:
         logger.error(f"Could not load or parse portfolio_config.yaml: {e}", exc_info=True)
         return {}